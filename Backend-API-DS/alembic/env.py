@@ -1,7 +1,9 @@
+import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 import os
@@ -69,13 +71,17 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection, target_metadata=target_metadata
+    )
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    with context.begin_transaction():
+        context.run_migrations()
 
-    """
+
+async def run_async_migrations() -> None:
+    """Run migrations through the same asyncpg driver the application uses."""
     # Try to get database URL from environment variable first
     db_url = os.getenv("DATABASE_URL")
     
@@ -89,28 +95,33 @@ def run_migrations_online() -> None:
             # Fall back to alembic.ini
             db_url = config.get_main_option("sqlalchemy.url")
     
-    # Convert asyncpg to psycopg2 for synchronous migrations
-    if db_url and db_url.startswith("postgresql+asyncpg://"):
-        db_url = db_url.replace("postgresql+asyncpg://", "postgresql://")
-    
-    # Create config dict with the modified URL
+    # Create config dict with the database URL
     configuration = {
         "sqlalchemy.url": db_url
     }
     
-    connectable = engine_from_config(
+    # Migrations and autogenerate reflection all run on the single connection
+    # opened below, so no pool is needed
+    connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    In this scenario we need to create an Engine
+    and associate a connection with the context.
 
-        with context.begin_transaction():
-            context.run_migrations()
+    """
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
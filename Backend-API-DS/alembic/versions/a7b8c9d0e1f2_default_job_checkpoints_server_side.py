@@ -0,0 +1,62 @@
+"""Default job checkpoints server-side and make them NOT NULL
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_CHECKPOINTS = '{"ocrCheckpoint": "pending", "dischargeMedicationsCheckpoint": "pending", "dischargeSummaryCheckpoint": "pending"}'
+BACKFILL_BATCH_SIZE = 10000
+
+
+def upgrade() -> None:
+    """Default jobs.checkpoints in PostgreSQL, backfill NULL rows, then forbid NULL."""
+    # Set the default first so jobs inserted during the backfill already get it
+    op.alter_column(
+        'jobs',
+        'checkpoints',
+        server_default=sa.text(f"'{DEFAULT_CHECKPOINTS}'::jsonb"),
+    )
+
+    # Backfill in small batches, each committed on its own, so a large jobs
+    # table is never locked by one long UPDATE
+    backfill = sa.text("""
+        WITH batch AS (
+            SELECT job_id FROM jobs
+            WHERE checkpoints IS NULL
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE jobs
+        SET checkpoints = CAST(:checkpoints AS jsonb)
+        FROM batch
+        WHERE jobs.job_id = batch.job_id
+    """)
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(
+                backfill,
+                {"batch_size": BACKFILL_BATCH_SIZE, "checkpoints": DEFAULT_CHECKPOINTS},
+            )
+            if result.rowcount == 0:
+                break
+
+    op.alter_column('jobs', 'checkpoints', nullable=False)
+
+
+def downgrade() -> None:
+    """Allow NULL checkpoints again and drop the server default."""
+    op.alter_column('jobs', 'checkpoints', nullable=True, server_default=None)
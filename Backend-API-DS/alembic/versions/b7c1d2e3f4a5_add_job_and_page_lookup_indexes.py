@@ -0,0 +1,56 @@
+"""Add lookup indexes for documents by job and pages by document
+
+Revision ID: b7c1d2e3f4a5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d2e3f4a5'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index documents.job_id and document_pages(document_id, page_number)."""
+    # CONCURRENTLY keeps the tables writable while the indexes build; it cannot
+    # run inside a transaction. The OCR result tables already have unique
+    # indexes on page_id from their UNIQUE constraints.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_documents_job_id',
+            'documents',
+            ['job_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_document_pages_document_id_page_number',
+            'document_pages',
+            ['document_id', 'page_number'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the lookup indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_document_pages_document_id_page_number',
+            table_name='document_pages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_documents_job_id',
+            table_name='documents',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
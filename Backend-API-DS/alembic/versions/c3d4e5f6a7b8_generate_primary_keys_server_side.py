@@ -0,0 +1,47 @@
+"""Generate UUID primary keys server-side
+
+Revision ID: c3d4e5f6a7b8
+Revises: b7c1d2e3f4a5
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b7c1d2e3f4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Primary key column of every table whose ids were generated in Python
+PRIMARY_KEYS = {
+    'auth_sessions': 'session_id',
+    'discharge_summaries': 'summary_id',
+    'documents': 'document_id',
+    'document_pages': 'page_id',
+    'hospitals': 'hospital_id',
+    'jobs': 'job_id',
+    'logs': 'log_id',
+    'ocr_deidentified_texts': 'id',
+    'ocr_raw_texts': 'id',
+    'ocr_spellchecked_texts': 'id',
+    'patients': 'patient_id',
+    'templates': 'template_id',
+    'upload_sessions': 'upload_session_id',
+    'users': 'user_id',
+}
+
+
+def upgrade() -> None:
+    """Default each primary key to gen_random_uuid() (built in since PostgreSQL 13)."""
+    for table, column in PRIMARY_KEYS.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT gen_random_uuid()::text")
+
+
+def downgrade() -> None:
+    """Drop the primary key defaults; ids are generated by the application again."""
+    for table, column in PRIMARY_KEYS.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,51 @@
+"""Default created_at / updated_at server-side
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns of every table, with the default matching the column type
+# (templates keeps naive UTC timestamps, everything else is timestamptz)
+TIMESTAMP_COLUMNS = {
+    'auth_sessions': ('created_at',),
+    'discharge_summaries': ('created_at', 'updated_at'),
+    'documents': ('created_at', 'updated_at'),
+    'document_pages': ('created_at', 'updated_at'),
+    'hospitals': ('created_at', 'updated_at'),
+    'jobs': ('created_at', 'updated_at'),
+    'logs': ('created_at',),
+    'ocr_deidentified_texts': ('created_at',),
+    'ocr_raw_texts': ('created_at',),
+    'ocr_spellchecked_texts': ('created_at',),
+    'patients': ('created_at', 'updated_at'),
+    'templates': ('created_at', 'updated_at'),
+    'upload_sessions': ('created_at', 'updated_at'),
+    'users': ('created_at', 'updated_at'),
+}
+
+
+def upgrade() -> None:
+    """Default the timestamp columns to the transaction time."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        default = "timezone('utc', now())" if table == 'templates' else "now()"
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
+
+
+def downgrade() -> None:
+    """Drop the timestamp defaults; they are set by the application again."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,53 @@
+"""Add composite lookup indexes for documents, sessions, summaries and logs
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_documents_patient_id_status', 'documents', ['patient_id', 'status']),
+    ('ix_documents_upload_session_id', 'documents', ['upload_session_id']),
+    ('ix_upload_sessions_user_id_status', 'upload_sessions', ['user_id', 'status']),
+    ('ix_discharge_summaries_job_id', 'discharge_summaries', ['job_id']),
+    ('ix_auth_sessions_user_id_expires_at', 'auth_sessions', ['user_id', 'expires_at']),
+    ('ix_logs_job_id_created_at', 'logs', ['job_id', 'created_at']),
+    ('ix_logs_document_id', 'logs', ['document_id']),
+]
+
+
+def upgrade() -> None:
+    """Create the lookup indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the lookup indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
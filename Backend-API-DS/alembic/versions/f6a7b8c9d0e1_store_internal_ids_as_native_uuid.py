@@ -0,0 +1,48 @@
+"""Store server-internal ids as native uuid
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Primary keys that are never referenced by another table or accepted from clients
+NATIVE_UUID_KEYS = {
+    'auth_sessions': 'session_id',
+    'logs': 'log_id',
+    'ocr_deidentified_texts': 'id',
+    'ocr_raw_texts': 'id',
+    'ocr_spellchecked_texts': 'id',
+}
+
+
+def upgrade() -> None:
+    """Convert the keys from varchar(36) to uuid (rewrites each table and its primary key index)."""
+    for table, column in NATIVE_UUID_KEYS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} DROP DEFAULT, "
+            f"ALTER COLUMN {column} TYPE uuid USING {column}::uuid, "
+            f"ALTER COLUMN {column} SET DEFAULT gen_random_uuid()"
+        )
+
+
+def downgrade() -> None:
+    """Convert the keys back to varchar(36)."""
+    for table, column in NATIVE_UUID_KEYS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} DROP DEFAULT, "
+            f"ALTER COLUMN {column} TYPE varchar(36) USING {column}::text, "
+            f"ALTER COLUMN {column} SET DEFAULT gen_random_uuid()::text"
+        )
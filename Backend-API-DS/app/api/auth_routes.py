@@ -19,6 +19,9 @@ from app.utils.logger import get_logger
 router = APIRouter(prefix="/auth", tags=["authentication"])
 logger = get_logger(__name__)
 
+# AuthService is stateless, so one instance is shared by every request
+_auth_service = get_auth_service()
+
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
@@ -29,13 +32,11 @@ async def login(
     """
     Authenticate user and return access token.
     """
-    auth_service = get_auth_service()
-    
     # Get client info for session tracking
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    result = await auth_service.login(
+    result = await _auth_service.login(
         session=session,
         email=login_data.email,
         password=login_data.password,
@@ -62,13 +63,11 @@ async def logout(
     """
     Logout current user and invalidate token.
     """
-    auth_service = get_auth_service()
-    
     # Get token from Authorization header
     auth_header = request.headers.get("authorization", "")
-    token = auth_header.replace("Bearer ", "") if auth_header.startswith("Bearer ") else ""
+    token = auth_header[7:] if auth_header.startswith("Bearer ") else ""
 
-    await auth_service.logout(session, token)
+    await _auth_service.logout(session, token)
     
     return {"message": "Successfully logged out"}
 
@@ -81,8 +80,7 @@ async def logout_all(
     """
     Logout from all devices/sessions.
     """
-    auth_service = get_auth_service()
-    count = await auth_service.logout_all(session, current_user.user_id)
+    count = await _auth_service.logout_all(session, current_user.user_id)
     
     return {"message": f"Successfully logged out from {count} session(s)"}
 
@@ -94,16 +92,7 @@ async def get_current_user_info(
     """
     Get current authenticated user information.
     """
-    return UserResponse(
-        user_id=current_user.user_id,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        role=current_user.role,
-        department=current_user.department,
-        hospital_id=current_user.hospital_id,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at,
-    )
+    return UserResponse.model_validate(current_user)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -115,9 +104,7 @@ async def register(
     Register a new user.
     Note: In production, this should be admin-only or have additional validation.
     """
-    auth_service = get_auth_service()
-    
-    user = await auth_service.register_user(
+    user = await _auth_service.register_user(
         session=session,
         email=register_data.email,
         password=register_data.password,
@@ -133,16 +120,7 @@ async def register(
             detail="Registration failed. Email may already exist or hospital not found.",
         )
 
-    return UserResponse(
-        user_id=user.user_id,
-        email=user.email,
-        full_name=user.full_name,
-        role=user.role,
-        department=user.department,
-        hospital_id=user.hospital_id,
-        is_active=user.is_active,
-        created_at=user.created_at,
-    )
+    return UserResponse.model_validate(user)
 
 
 @router.post("/change-password", status_code=status.HTTP_200_OK)
@@ -154,9 +132,7 @@ async def change_password(
     """
     Change current user's password.
     """
-    auth_service = get_auth_service()
-    
-    success = await auth_service.change_password(
+    success = await _auth_service.change_password(
         session=session,
         user_id=current_user.user_id,
         current_password=password_data.current_password,
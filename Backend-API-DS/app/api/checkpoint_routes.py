@@ -1,9 +1,13 @@
 """
 Checkpoint routes for human verification tracking
 """
+import json
+from types import MappingProxyType
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.db.session import get_db_session
 from app.db.models.job import Job
@@ -19,6 +23,32 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter(prefix="/session-status-checkpoints", tags=["checkpoints"])
 
+_CHECKPOINTS_BY_JOB = select(Job.checkpoints).where(Job.job_id == bindparam("job_id"))
+
+# Shared read-only default checkpoints
+_DEFAULT_CHECKPOINTS = MappingProxyType({
+    "ocrCheckpoint": "pending",
+    "dischargeMedicationsCheckpoint": "pending",
+    "dischargeSummaryCheckpoint": "pending"
+})
+
+
+# Atomic server-side update of one checkpoint; rows without an object value start from defaults
+_UPDATE_CHECKPOINT = text("""
+    UPDATE jobs
+    SET checkpoints = jsonb_set(
+        CASE WHEN jsonb_typeof(checkpoints) = 'object'
+            THEN checkpoints
+            ELSE CAST(:default AS jsonb)
+        END,
+        ARRAY[CAST(:checkpoint_name AS text)],
+        to_jsonb(CAST(:status AS text))
+    )
+    WHERE job_id = :job_id
+    RETURNING checkpoints
+""").bindparams(default=json.dumps(dict(_DEFAULT_CHECKPOINTS))).columns(checkpoints=JSONB)
+
+
 @router.get("/{job_id}", response_model=CheckpointResponse)
 async def get_checkpoints(
     job_id: str,
@@ -27,29 +57,15 @@ async def get_checkpoints(
     """Get checkpoint status for a job"""
     logger.info(f"🔍 Fetching checkpoints for job: {job_id}")
     
-    result = await session.execute(
-        select(Job).where(Job.job_id == job_id)
-    )
-    job = result.scalar_one_or_none()
+    # Only the checkpoints column is needed, so skip hydrating a Job instance
+    row = (await session.execute(_CHECKPOINTS_BY_JOB, {"job_id": job_id})).first()
     
-    if not job:
+    if row is None:
         logger.error(f"❌ Job {job_id} not found in database")
         raise HTTPException(status_code=404, detail="Job not found")
     
     # Get checkpoints or use default
-    raw_checkpoints = job.checkpoints
-    if isinstance(raw_checkpoints, str):
-        import json
-        try:
-            raw_checkpoints = json.loads(raw_checkpoints)
-        except:
-            raw_checkpoints = None
-
-    checkpoints = raw_checkpoints or {
-        "ocrCheckpoint": "pending",
-        "dischargeMedicationsCheckpoint": "pending",
-        "dischargeSummaryCheckpoint": "pending"
-    }
+    checkpoints = row[0] or _DEFAULT_CHECKPOINTS
     
     logger.info(f"✅ Checkpoints for {job_id}: {checkpoints}")
     
@@ -75,37 +91,18 @@ async def update_checkpoint(
     logger.info(f"📝 Updating checkpoint for {job_id}: {update.checkpoint_name} -> {update.status}")
     
     result = await session.execute(
-        select(Job).where(Job.job_id == job_id)
+        _UPDATE_CHECKPOINT,
+        {
+            "job_id": job_id,
+            "checkpoint_name": update.checkpoint_name,
+            "status": update.status,
+        },
     )
-    job = result.scalar_one_or_none()
+    checkpoints = result.scalar_one_or_none()
     
-    if not job:
+    if checkpoints is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Initialize checkpoints if None
-    if job.checkpoints is None:
-        job.checkpoints = {
-            "ocrCheckpoint": "pending",
-            "dischargeMedicationsCheckpoint": "pending",
-            "dischargeSummaryCheckpoint": "pending"
-        }
-    
-    # Update checkpoint
-    curr_checkpoints = job.checkpoints
-    if isinstance(curr_checkpoints, str):
-        import json
-        try:
-            curr_checkpoints = json.loads(curr_checkpoints)
-        except:
-            curr_checkpoints = {}
-            
-    checkpoints = dict(curr_checkpoints)  # Create mutable copy
-    checkpoints[update.checkpoint_name] = update.status
-    job.checkpoints = checkpoints
-    
-    from sqlalchemy.orm.attributes import flag_modified
-    flag_modified(job, "checkpoints")
-    
     await session.commit()
     
     all_completed = all(
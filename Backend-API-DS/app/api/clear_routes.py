@@ -3,12 +3,15 @@ Clear API routes for removing uploaded files before processing.
 This allows users to remove incorrectly uploaded files from the frontend.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select
 
 from app.db.session import get_db_session
 from app.db.models.document import Document
+from app.db.models.document_page import DocumentPage
 from app.db.models.job import Job
 from app.services.storage_service import StorageService
 from app.utils.logger import get_logger
@@ -17,6 +20,83 @@ router = APIRouter(prefix="/clear", tags=["clear"])
 storage_service = StorageService()
 logger = get_logger(__name__)
 
+# Documents are streamed from the database and cleared from MinIO in batches of this size
+_CLEAR_BATCH_SIZE = 200
+
+# Batches being cleared from MinIO at once per request; the stream waits for a
+# free slot, so only this many partitions are held in memory
+_CLEAR_CONCURRENCY = 4
+
+# Statements built once so SQLAlchemy's compiled cache is reused across requests
+_DOCUMENT_PATHS_BY_JOB = (
+    select(Document.original_file_path, Document.document_id)
+    .where(Document.job_id == bindparam("job_id"))
+    .execution_options(yield_per=_CLEAR_BATCH_SIZE)
+)
+_DOCUMENT_BY_ID = select(Document).where(Document.document_id == bindparam("document_id"))
+# Bulk deletes for clear_all_job_data, executed children first to respect foreign keys
+_DELETE_JOB_PAGES = (
+    delete(DocumentPage)
+    .where(
+        DocumentPage.document_id.in_(
+            select(Document.document_id).where(Document.job_id == bindparam("job_id"))
+        )
+    )
+    .execution_options(synchronize_session=False)
+)
+_DELETE_JOB_DOCUMENTS = (
+    delete(Document)
+    .where(Document.job_id == bindparam("job_id"))
+    .execution_options(synchronize_session=False)
+)
+_DELETE_JOB = (
+    delete(Job)
+    .where(Job.job_id == bindparam("job_id"))
+    .execution_options(synchronize_session=False)
+)
+
+
+async def _clear_batch(job_id: str, batch) -> int:
+    """Delete one partition of documents' files from MinIO; returns the documents cleared."""
+    paths = [row.original_file_path for row in batch if row.original_file_path]
+    directories = [f"documents/{job_id}/{row.document_id}" for row in batch]
+    await storage_service.delete_files_bulk(paths, directories)
+    return len(batch)
+
+
+async def _clear_job_storage(session: AsyncSession, job_id: str, event: str) -> tuple[int, int]:
+    """
+    Delete original files and document directories (OCR, spellcheck, deid outputs)
+    for every document of a job. Each streamed partition becomes one batched MinIO
+    delete; up to _CLEAR_CONCURRENCY batches run at once.
+    
+    Returns:
+        Tuple of (documents found, documents cleared)
+    """
+    semaphore = asyncio.Semaphore(_CLEAR_CONCURRENCY)
+    document_count = 0
+    cleared_count = 0
+    
+    async def clear(batch) -> None:
+        nonlocal cleared_count
+        try:
+            cleared = await _clear_batch(job_id, batch)
+        except Exception as e:
+            logger.warning(event, job_id=job_id, error=str(e))
+        else:
+            cleared_count += cleared
+        finally:
+            semaphore.release()
+    
+    stream = await session.stream(_DOCUMENT_PATHS_BY_JOB, {"job_id": job_id})
+    async with asyncio.TaskGroup() as task_group:
+        async for batch in stream.partitions():
+            document_count += len(batch)
+            # Wait for a free slot before reading the next partition
+            await semaphore.acquire()
+            task_group.create_task(clear(batch))
+    return document_count, cleared_count
+
 
 @router.post("/files/{job_id}")
 async def clear_job_files(
@@ -36,10 +116,7 @@ async def clear_job_files(
     """
     try:
         # Fetch the job
-        result = await session.execute(
-            select(Job).where(Job.job_id == job_id)
-        )
-        job = result.scalar_one_or_none()
+        job = await session.get(Job, job_id)
         
         if not job:
             raise HTTPException(
@@ -47,13 +124,11 @@ async def clear_job_files(
                 detail=f"Job {job_id} not found"
             )
         
-        # Fetch all documents for this job
-        result = await session.execute(
-            select(Document).where(Document.job_id == job_id)
+        document_count, cleared_count = await _clear_job_storage(
+            session, job_id, "clear.file_clear_failed"
         )
-        documents = result.scalars().all()
         
-        if not documents:
+        if not document_count:
             logger.info("clear.no_documents", job_id=job_id)
             return {
                 "job_id": job_id,
@@ -62,32 +137,6 @@ async def clear_job_files(
                 "message": "No files found for this job"
             }
         
-        # Clear files from MinIO for each document
-        cleared_count = 0
-        for document in documents:
-            try:
-                # Delete original file
-                if document.original_file_path:
-                    await storage_service.delete_file(document.original_file_path)
-                
-                # Delete entire document directory (includes all OCR, spellcheck, deid outputs)
-                if document.document_id:
-                    await storage_service.delete_directory(f"documents/{job_id}/{document.document_id}")
-                
-                cleared_count += 1
-                logger.info(
-                    "clear.file_cleared",
-                    job_id=job_id,
-                    document_id=document.document_id
-                )
-            except Exception as e:
-                logger.warning(
-                    "clear.file_clear_failed",
-                    job_id=job_id,
-                    document_id=document.document_id,
-                    error=str(e)
-                )
-        
         logger.info(
             "clear.completed",
             job_id=job_id,
@@ -97,7 +146,7 @@ async def clear_job_files(
         return {
             "job_id": job_id,
             "cleared_files": cleared_count,
-            "cleared_documents": len(documents),
+            "cleared_documents": document_count,
             "status": "success",
             "message": f"Cleared {cleared_count} files from MinIO storage"
         }
@@ -130,9 +179,7 @@ async def clear_document_files(
     """
     try:
         # Fetch the document
-        result = await session.execute(
-            select(Document).where(Document.document_id == document_id)
-        )
+        result = await session.execute(_DOCUMENT_BY_ID, {"document_id": document_id})
         document = result.scalar_one_or_none()
         
         if not document:
@@ -190,10 +237,7 @@ async def clear_all_job_data(
     """
     try:
         # Fetch the job
-        result = await session.execute(
-            select(Job).where(Job.job_id == job_id)
-        )
-        job = result.scalar_one_or_none()
+        job = await session.get(Job, job_id)
         
         if not job:
             raise HTTPException(
@@ -201,45 +245,32 @@ async def clear_all_job_data(
                 detail=f"Job {job_id} not found"
             )
         
-        # Fetch all documents for this job
-        result = await session.execute(
-            select(Document).where(Document.job_id == job_id)
+        # Delete files from MinIO in batches
+        document_count, cleared_count = await _clear_job_storage(
+            session, job_id, "clear_all.file_clear_failed"
         )
-        documents = result.scalars().all()
-        
-        # Delete files from MinIO
-        cleared_count = 0
-        for document in documents:
-            try:
-                if document.original_file_path:
-                    await storage_service.delete_file(document.original_file_path)
-                await storage_service.delete_directory(f"documents/{job_id}/{document.document_id}")
-                cleared_count += 1
-            except Exception as e:
-                logger.warning(
-                    "clear_all.file_clear_failed",
-                    job_id=job_id,
-                    document_id=document.document_id,
-                    error=str(e)
-                )
         
-        # Delete database records (cascading delete via SQLAlchemy relationships)
-        await session.delete(job)
+        # Delete database records with one bulk statement per table in the same
+        # transaction (OCR outputs follow their pages via ON DELETE CASCADE)
+        params = {"job_id": job_id}
+        await session.execute(_DELETE_JOB_PAGES, params)
+        await session.execute(_DELETE_JOB_DOCUMENTS, params)
+        await session.execute(_DELETE_JOB, params)
         await session.commit()
         
         logger.info(
             "clear_all.completed",
             job_id=job_id,
             cleared_files=cleared_count,
-            cleared_documents=len(documents)
+            cleared_documents=document_count
         )
         
         return {
             "job_id": job_id,
             "cleared_files": cleared_count,
-            "cleared_documents": len(documents),
+            "cleared_documents": document_count,
             "status": "success",
-            "message": f"Completely cleared job: {cleared_count} files and {len(documents)} documents removed"
+            "message": f"Completely cleared job: {cleared_count} files and {document_count} documents removed"
         }
     
     except HTTPException:
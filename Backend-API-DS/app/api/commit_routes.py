@@ -1,22 +1,46 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from typing import List, Optional
 
 from app.db.models.document import Document
 from app.db.models.job import Job
 from app.db.session import get_db_session
 from app.utils.logger import get_logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/commit", tags=["commit"])
 
+# Built once so SQLAlchemy's compiled cache is reused; loads only the columns returned
+_DOCUMENTS_BY_JOB = (
+    select(Document)
+    .options(
+        load_only(
+            Document.document_id,
+            Document.patient_id,
+            Document.hospital_id,
+            Document.doc_type,
+            Document.file_path,
+            Document.original_file_path,
+            Document.status,
+            Document.created_at,
+            Document.updated_at,
+        )
+    )
+    .where(Document.job_id == bindparam("job_id"))
+)
+
 
 class DocumentInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     document_id: str
     patient_id: str
     hospital_id: str
@@ -24,8 +48,11 @@ class DocumentInfo(BaseModel):
     file_path: str
     original_file_path: Optional[str] = None
     status: str
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
+
+
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentInfo])
 
 
 class CommitResponse(BaseModel):
@@ -57,9 +84,7 @@ async def commit_documents(
         
         # Get all documents for this job
         documents = (
-            await session.scalars(
-                select(Document).where(Document.job_id == job_id)
-            )
+            await session.scalars(_DOCUMENTS_BY_JOB, {"job_id": job_id})
         ).all()
         
         if not documents:
@@ -69,20 +94,7 @@ async def commit_documents(
             )
         
         # Convert documents to response format
-        document_list = [
-            DocumentInfo(
-                document_id=doc.document_id,
-                patient_id=doc.patient_id,
-                hospital_id=doc.hospital_id,
-                doc_type=doc.doc_type,
-                file_path=doc.file_path,
-                original_file_path=doc.original_file_path,
-                status=doc.status,
-                created_at=str(doc.created_at),
-                updated_at=str(doc.updated_at),
-            )
-            for doc in documents
-        ]
+        document_list = _DOCUMENT_LIST_ADAPTER.validate_python(documents, from_attributes=True)
         
         logger.info(
             "commit.documents_retrieved",
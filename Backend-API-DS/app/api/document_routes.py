@@ -3,20 +3,25 @@ from __future__ import annotations
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy import select, delete
+from pydantic import TypeAdapter
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.document import Document
 from app.db.models.job import Job
 from app.db.session import get_db_session
 from app.schemas.document_schema import DocumentOut, DocumentsResponse
-from app.services.storage_service import get_storage_service
+from app.services.storage_service import StorageService, get_storage_service
 from app.utils.logger import get_logger
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 logger = get_logger(__name__)
-storage_service = get_storage_service()
 
+# Rows fetched per round trip when streaming large document listings
+_STREAM_BATCH_SIZE = 500
+
+# Validates a whole listing in one call instead of one model_validate per row
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentOut])
 
 @router.get("", response_model=DocumentsResponse)
 async def list_documents(
@@ -26,14 +31,19 @@ async def list_documents(
     status_filter: Optional[str] = Query(None, alias="status"),
     session: AsyncSession = Depends(get_db_session),
 ) -> DocumentsResponse:
-    stmt = select(Document).where(Document.patient_id == patient_id, Document.hospital_id == hospital_id)
+    # Lambda statements cache their compiled SQL; only the bound values change per call
+    stmt = lambda_stmt(
+        lambda: select(Document).where(Document.patient_id == patient_id, Document.hospital_id == hospital_id)
+    )
     if doc_type:
-        stmt = stmt.where(Document.doc_type == doc_type)
+        stmt += lambda s: s.where(Document.doc_type == doc_type)
     if status_filter:
-        stmt = stmt.where(Document.status == status_filter)
+        stmt += lambda s: s.where(Document.status == status_filter)
 
-    documents = (await session.scalars(stmt)).all()
-    return DocumentsResponse(documents=[DocumentOut.model_validate(doc, from_attributes=True) for doc in documents])
+    # Stream rows through a server-side cursor instead of buffering the whole result set
+    result = await session.stream_scalars(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+    documents = [doc async for doc in result]
+    return DocumentsResponse(documents=_DOCUMENT_LIST_ADAPTER.validate_python(documents, from_attributes=True))
 
 
 @router.delete("")
@@ -43,6 +53,7 @@ async def delete_records(
     job_id: Optional[str] = Query(None),
     doc_id: Optional[str] = Query(None),
     session: AsyncSession = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
 ) -> dict:
     """
     Delete records from database AND MinIO storage based on patient_id, hospital_id, job_id, and/or doc_id.
@@ -65,26 +76,24 @@ async def delete_records(
         )
     
     try:
-        # First, retrieve all documents that match the criteria (before deleting)
-        select_stmt = select(Document)
-        filters = []
-        
+        # Build the filtered delete as a cached lambda statement, combined with AND logic
+        stmt = lambda_stmt(lambda: delete(Document))
         if patient_id:
-            filters.append(Document.patient_id == patient_id)
+            stmt += lambda s: s.where(Document.patient_id == patient_id)
         if hospital_id:
-            filters.append(Document.hospital_id == hospital_id)
+            stmt += lambda s: s.where(Document.hospital_id == hospital_id)
         if job_id:
-            filters.append(Document.job_id == job_id)
+            stmt += lambda s: s.where(Document.job_id == job_id)
         if doc_id:
-            filters.append(Document.document_id == doc_id)
+            stmt += lambda s: s.where(Document.document_id == doc_id)
         
-        # Combine filters with AND logic
-        if filters:
-            for filter_condition in filters:
-                select_stmt = select_stmt.where(filter_condition)
-        
-        # Get all documents that will be deleted
-        documents_to_delete = (await session.scalars(select_stmt)).all()
+        # Delete from database, returning the storage paths of the deleted documents
+        # (one round trip, no pre-select); committed after MinIO cleanup below
+        stmt += lambda s: s.returning(Document.document_id, Document.original_file_path, Document.file_path)
+        deleted_rows = (
+            await session.execute(stmt, execution_options={"synchronize_session": False})
+        ).all()
+        db_deleted_count = len(deleted_rows)
         
         logger.info(
             "documents.delete_started",
@@ -92,59 +101,28 @@ async def delete_records(
             hospital_id=hospital_id,
             job_id=job_id,
             doc_id=doc_id,
-            document_count=len(documents_to_delete)
+            document_count=db_deleted_count
         )
         
         # Delete from MinIO storage
         minio_deleted_count = 0
         minio_errors = []
         
-        for doc in documents_to_delete:
-            try:
-                # Delete original file
-                if doc.original_file_path:
-                    await storage_service.delete_file(doc.original_file_path)
-                    logger.info("documents.minio_file_deleted", file_path=doc.original_file_path)
-                    minio_deleted_count += 1
-                
-                # Delete directory with all converted images and results
-                if doc.file_path:
-                    # Try to delete all files in the document's directory
-                    try:
-                        await storage_service.delete_directory(doc.file_path)
-                        logger.info("documents.minio_directory_deleted", directory_path=doc.file_path)
-                    except Exception as e:
-                        # Directory deletion might fail if directory doesn't exist, log but continue
-                        logger.warning(
-                            "documents.minio_directory_delete_failed",
-                            directory_path=doc.file_path,
-                            error=str(e)
-                        )
-            
-            except Exception as e:
-                error_msg = f"Failed to delete MinIO file for document {doc.document_id}: {str(e)}"
-                minio_errors.append(error_msg)
-                logger.error("documents.minio_delete_error", document_id=doc.document_id, error=str(e))
-        
-        # Delete from database
-        # Use the same select statement to identify documents, then delete them
-        delete_stmt = delete(Document).where(select_stmt.whereclause is not None)
-        
-        # Build delete statement with the same filters
-        if doc_id:
-            delete_stmt = delete(Document).where(Document.document_id == doc_id)
-        elif patient_id or hospital_id or job_id:
-            delete_stmt = delete(Document)
-            if patient_id:
-                delete_stmt = delete_stmt.where(Document.patient_id == patient_id)
-            if hospital_id:
-                delete_stmt = delete_stmt.where(Document.hospital_id == hospital_id)
-            if job_id:
-                delete_stmt = delete_stmt.where(Document.job_id == job_id)
-        
-        # Execute delete
-        result = await session.execute(delete_stmt)
-        db_deleted_count = result.rowcount
+        # Original files plus every object under each document's directory
+        # (converted images and results), removed in batched multi-object deletes
+        original_paths = [row.original_file_path for row in deleted_rows if row.original_file_path]
+        directories = [row.file_path for row in deleted_rows if row.file_path]
+        try:
+            await storage_service.delete_files_bulk(original_paths, directories)
+            minio_deleted_count = len(original_paths)
+            logger.info(
+                "documents.minio_files_deleted",
+                file_count=len(original_paths),
+                directory_count=len(directories)
+            )
+        except Exception as e:
+            minio_errors.append(f"Failed to delete MinIO files: {str(e)}")
+            logger.error("documents.minio_delete_error", error=str(e))
         
         await session.commit()
         
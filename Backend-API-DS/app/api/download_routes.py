@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import zipfile
-from typing import Optional
+from datetime import timedelta
+from typing import AsyncIterable, AsyncIterator, Optional
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy import select
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.document import Document
@@ -15,15 +17,163 @@ from app.db.models.document_page import DocumentPage
 from app.db.models.ocr_raw_text import OcrRawText
 from app.db.models.ocr_spellchecked_text import OcrSpellcheckedText
 from app.db.models.ocr_deidentified_text import OcrDeidentifiedText
+from app.config.settings import get_settings
 from app.db.session import get_db_session
-from app.services.storage_service import get_storage_service
+from app.services.storage_service import StorageService, get_storage_service
 from app.utils.logger import get_logger
-from app.utils.minio_client import get_minio_client
+from app.utils.minio_client import AsyncMinioClient, get_minio_client
 
 router = APIRouter(prefix="/download", tags=["download"])
 logger = get_logger(__name__)
-storage_service = get_storage_service()
-minio_client = get_minio_client()
+settings = get_settings()
+
+
+# Rows fetched per round trip when streaming document queries
+_STREAM_BATCH_SIZE = 500
+
+# Maximum MinIO requests in flight across all downloads served by this worker
+_FETCH_CONCURRENCY = 32
+_MINIO_SEMAPHORE = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+# Processed output model and its text column, by download file_type
+_PROCESSED_TEXT_SOURCES = {
+    "ocr": (OcrRawText, OcrRawText.raw_text),
+    "spellcheck": (OcrSpellcheckedText, OcrSpellcheckedText.spellchecked_text),
+    "deid": (OcrDeidentifiedText, OcrDeidentifiedText.deid_text),
+}
+
+# Bytes per chunk when streaming a single file from MinIO
+_CHUNK_SIZE = 64 * 1024
+
+# Retrieved files buffered ahead of the zip writer
+_PREFETCH_DEPTH = 8
+
+# Result folders stored per document in MinIO
+_RESULT_TYPES = ("ocr", "spellcheck", "deid")
+
+
+def _filter_documents(
+    stmt: StatementLambdaElement,
+    patient_id: Optional[str],
+    hospital_id: Optional[str],
+    job_id: Optional[str],
+) -> StatementLambdaElement:
+    """Add the patient/hospital/job filters to a cached lambda statement over Document."""
+    if patient_id:
+        stmt += lambda s: s.where(Document.patient_id == patient_id)
+    if hospital_id:
+        stmt += lambda s: s.where(Document.hospital_id == hospital_id)
+    if job_id:
+        stmt += lambda s: s.where(Document.job_id == job_id)
+    return stmt
+
+
+async def _list_objects(minio_client: AsyncMinioClient, prefix: str | None) -> list[str]:
+    """List object names under a MinIO prefix; an empty prefix lists nothing."""
+    if not prefix:
+        return []
+    async with _MINIO_SEMAPHORE:
+        return await minio_client.list_objects_in_directory(prefix)
+
+
+async def _list_prefixes(minio_client: AsyncMinioClient, prefixes: list[str | None]) -> list[list[str]]:
+    """List several MinIO prefixes concurrently, returning object names in prefix order."""
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(_list_objects(minio_client, prefix)) for prefix in prefixes]
+    return [task.result() for task in tasks]
+
+
+async def _retrieve_files(
+    storage_service: StorageService,
+    files: list[tuple[str, str]],
+) -> AsyncIterator[tuple[str, str, bytes | BaseException]]:
+    """
+    Retrieve (zip path, MinIO path) pairs concurrently, yielding (zip path, MinIO path, content)
+    as downloads complete. Failed downloads yield the exception in place of the content.
+    
+    A background producer runs up to _FETCH_CONCURRENCY workers that pull from a shared
+    iterator of files; each MinIO request also takes a slot of the shared _MINIO_SEMAPHORE.
+    A worker queues its file before fetching the next one, so at most _FETCH_CONCURRENCY +
+    _PREFETCH_DEPTH files are held in memory while the consumer zips earlier ones.
+    Cancelling the producer cancels every outstanding download.
+    """
+    queue: asyncio.Queue[tuple[str, str, bytes | BaseException] | None] = asyncio.Queue(
+        maxsize=_PREFETCH_DEPTH
+    )
+    pending = iter(files)
+    
+    async def worker() -> None:
+        # Shared iterator: each file is taken by exactly one worker
+        for zip_path, minio_path in pending:
+            async with _MINIO_SEMAPHORE:
+                try:
+                    content = await storage_service.retrieve_file(minio_path)
+                except Exception as e:
+                    content = e
+            # Queue outside the semaphore so a slow consumer does not hold MinIO slots;
+            # the worker itself waits here, which caps the files held in memory
+            await queue.put((zip_path, minio_path, content))
+    
+    async def producer() -> None:
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(min(_FETCH_CONCURRENCY, len(files))):
+                task_group.create_task(worker())
+        await queue.put(None)
+    
+    producer_task = asyncio.create_task(producer())
+    try:
+        while (item := await queue.get()) is not None:
+            yield item
+        await producer_task
+    finally:
+        # Stop outstanding downloads if the consumer goes away early
+        producer_task.cancel()
+
+
+class _ZipStreamSink:
+    """Write-only file object for zipfile; buffers written bytes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_zip(
+    entries: AsyncIterable[tuple[str, bytes | str, int | None]],
+    compression: int = zipfile.ZIP_DEFLATED,
+    compresslevel: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Build a zip archive incrementally, yielding each entry's bytes as soon as it is written.
+    Entries are (name, content, compress_type); a compress_type of None uses `compression`.
+    Compressed entries are written from a worker thread.
+    The sink is not seekable, so zipfile emits data descriptors instead of rewriting headers.
+    """
+    sink = _ZipStreamSink()
+    with zipfile.ZipFile(sink, 'w', compression, compresslevel=compresslevel) as zip_file:
+        async for name, content, compress_type in entries:
+            if (compress_type if compress_type is not None else compression) == zipfile.ZIP_STORED:
+                zip_file.writestr(name, content, compress_type=compress_type)
+            else:
+                # zlib releases the GIL, so deflating in a worker thread keeps the
+                # event loop free to serve other requests
+                await asyncio.to_thread(zip_file.writestr, name, content, compress_type=compress_type)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    # Central directory written on close
+    yield sink.drain()
 
 
 @router.get("/original")
@@ -32,6 +182,8 @@ async def download_original_file(
     hospital_id: Optional[str] = Query(None),
     job_id: Optional[str] = Query(None),
     session: AsyncSession = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+    minio_client: AsyncMinioClient = Depends(get_minio_client),
 ):
     """
     Download original uploaded files.
@@ -57,66 +209,92 @@ async def download_original_file(
         )
     
     try:
-        # Build query to find documents
-        stmt = select(Document)
-        if patient_id:
-            stmt = stmt.where(Document.patient_id == patient_id)
-        if hospital_id:
-            stmt = stmt.where(Document.hospital_id == hospital_id)
-        if job_id:
-            stmt = stmt.where(Document.job_id == job_id)
+        # Build query to find documents; only their original file paths are needed
+        stmt = _filter_documents(
+            lambda_stmt(lambda: select(Document.original_file_path)), patient_id, hospital_id, job_id
+        )
         
-        documents = (await session.scalars(stmt)).all()
+        # Probe with LIMIT 2: enough to tell "none", "one" and "more than one" apart
+        # without loading every matching document up front
+        probe = (await session.scalars(stmt + (lambda s: s.limit(2)))).all()
         
-        if not documents:
+        if not probe:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No documents found matching the criteria"
             )
         
-        logger.info(
-            "download.original.start",
-            patient_id=patient_id,
-            hospital_id=hospital_id,
-            job_id=job_id,
-            documents_count=len(documents)
-        )
-        
         # If single document, return single file
-        if len(documents) == 1:
-            doc = documents[0]
-            if not doc.original_file_path:
+        if len(probe) == 1:
+            original_file_path = probe[0]
+            
+            logger.info(
+                "download.original.start",
+                patient_id=patient_id,
+                hospital_id=hospital_id,
+                job_id=job_id,
+                documents_count=1
+            )
+            
+            if not original_file_path:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Original file path not found"
                 )
             
-            file_content = await storage_service.retrieve_file(doc.original_file_path)
-            filename = Path(doc.original_file_path).name
+            filename = Path(original_file_path).name
+            
+            # Let the client fetch straight from MinIO when presigned downloads are enabled
+            if settings.minio_presigned_downloads:
+                url = await minio_client.presigned_download_url(
+                    original_file_path,
+                    expires=timedelta(minutes=settings.minio_presigned_expiry_minutes),
+                )
+                logger.info("download.original.single_file_redirect", filename=filename)
+                return RedirectResponse(url, status_code=status.HTTP_302_FOUND)
+            
+            file_stream = await minio_client.open_stream(original_file_path, _CHUNK_SIZE)
             
             logger.info("download.original.single_file", filename=filename)
             
             return StreamingResponse(
-                iter([file_content]),
+                file_stream,
                 media_type="application/octet-stream",
                 headers={"Content-Disposition": f"attachment; filename={filename}"}
             )
         
-        # Multiple documents - return as zip
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for doc in documents:
-                if doc.original_file_path:
-                    file_content = await storage_service.retrieve_file(doc.original_file_path)
-                    filename = Path(doc.original_file_path).name
-                    zip_file.writestr(filename, file_content)
+        # Multiple documents - stream the full result set through a server-side cursor
+        # and stream the originals as a zip
+        documents_count = 0
+        original_files = []
+        original_paths = await session.stream_scalars(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+        async for original_file_path in original_paths:
+            documents_count += 1
+            if original_file_path:
+                original_files.append((Path(original_file_path).name, original_file_path))
         
-        zip_buffer.seek(0)
+        logger.info(
+            "download.original.start",
+            patient_id=patient_id,
+            hospital_id=hospital_id,
+            job_id=job_id,
+            documents_count=documents_count
+        )
         
-        logger.info("download.original.zip_file", documents_count=len(documents))
+        async def original_entries():
+            async for filename, minio_path, file_content in _retrieve_files(storage_service, original_files):
+                # The response has already started, so a failed file is logged and
+                # left out rather than cutting the zip short
+                if isinstance(file_content, BaseException):
+                    logger.warning("download.original.file_error", minio_path=minio_path, error=str(file_content))
+                    continue
+                yield filename, file_content, None
         
+        logger.info("download.original.zip_file", documents_count=documents_count)
+        
+        # Originals (PDF/JPEG/PNG) are already compressed, so they are stored as-is
         return StreamingResponse(
-            iter([zip_buffer.getvalue()]),
+            _stream_zip(original_entries(), zipfile.ZIP_STORED),
             media_type="application/zip",
             headers={"Content-Disposition": "attachment; filename=original_files.zip"}
         )
@@ -164,17 +342,12 @@ async def download_processed_files(
     
     try:
         # Build query to find documents
-        stmt = select(Document)
-        if patient_id:
-            stmt = stmt.where(Document.patient_id == patient_id)
-        if hospital_id:
-            stmt = stmt.where(Document.hospital_id == hospital_id)
-        if job_id:
-            stmt = stmt.where(Document.job_id == job_id)
+        stmt = _filter_documents(lambda_stmt(lambda: select(Document.document_id)), patient_id, hospital_id, job_id)
         
-        documents = (await session.scalars(stmt)).all()
+        result = await session.stream_scalars(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+        document_ids = [document_id async for document_id in result]
         
-        if not documents:
+        if not document_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No documents found matching the criteria"
@@ -186,61 +359,48 @@ async def download_processed_files(
             hospital_id=hospital_id,
             job_id=job_id,
             file_type=file_type,
-            documents_count=len(documents)
+            documents_count=len(document_ids)
+        )
+        
+        # Collect all files to download: pages and the requested OCR, spell check and
+        # de-identification text for every document in one joined query; only the text
+        # columns are selected, so plain rows come back without ORM hydration
+        result_types = list(_PROCESSED_TEXT_SOURCES) if file_type == "all" else [file_type]
+        stmt = select(
+            DocumentPage.document_id,
+            DocumentPage.page_number,
+            *(_PROCESSED_TEXT_SOURCES[result_type][1] for result_type in result_types),
+        )
+        for result_type in result_types:
+            model = _PROCESSED_TEXT_SOURCES[result_type][0]
+            stmt = stmt.outerjoin(model, model.page_id == DocumentPage.page_id)
+        stmt = (
+            stmt.where(DocumentPage.document_id.in_(document_ids))
+            .order_by(DocumentPage.document_id, DocumentPage.page_number)
         )
+        rows = (await session.execute(stmt)).all()
         
-        # Collect all files to download
         files_to_download = []
         
-        for doc in documents:
-            pages = (
-                await session.scalars(
-                    select(DocumentPage).where(DocumentPage.document_id == doc.document_id)
-                )
-            ).all()
-            
-            for page in pages:
-                # Fetch OCR data
-                if file_type in ["ocr", "all"]:
-                    raw = await session.scalar(
-                        select(OcrRawText).where(OcrRawText.page_id == page.page_id)
-                    )
-                    if raw:
-                        files_to_download.append({
-                            "type": "ocr",
-                            "doc_id": doc.document_id[:8],
-                            "page": page.page_number,
-                            "text": raw.raw_text,
-                            "filename": f"ocr_{doc.document_id[:8]}_page_{page.page_number}.txt"
-                        })
-                
-                # Fetch Spell Check data
-                if file_type in ["spellcheck", "all"]:
-                    spellcheck = await session.scalar(
-                        select(OcrSpellcheckedText).where(OcrSpellcheckedText.page_id == page.page_id)
-                    )
-                    if spellcheck:
-                        files_to_download.append({
-                            "type": "spellcheck",
-                            "doc_id": doc.document_id[:8],
-                            "page": page.page_number,
-                            "text": spellcheck.spellchecked_text,
-                            "filename": f"spellcheck_{doc.document_id[:8]}_page_{page.page_number}.txt"
-                        })
-                
-                # Fetch De-identification data
-                if file_type in ["deid", "all"]:
-                    deid = await session.scalar(
-                        select(OcrDeidentifiedText).where(OcrDeidentifiedText.page_id == page.page_id)
-                    )
-                    if deid:
-                        files_to_download.append({
-                            "type": "deid",
-                            "doc_id": doc.document_id[:8],
-                            "page": page.page_number,
-                            "text": deid.deid_text,
-                            "filename": f"deid_{doc.document_id[:8]}_page_{page.page_number}.txt"
-                        })
+        doc_id_short = None
+        previous_document_id = None
+        
+        for document_id, page_number, *texts in rows:
+            # Rows are ordered by document, so the short id changes only between documents
+            if document_id != previous_document_id:
+                previous_document_id = document_id
+                doc_id_short = document_id[:8]
+            page_suffix = f"_{doc_id_short}_page_{page_number}.txt"
+            for result_type, text in zip(result_types, texts):
+                if text is None:
+                    continue
+                files_to_download.append({
+                    "type": result_type,
+                    "doc_id": doc_id_short,
+                    "page": page_number,
+                    "text": text,
+                    "filename": result_type + page_suffix
+                })
         
         if not files_to_download:
             raise HTTPException(
@@ -248,13 +408,10 @@ async def download_processed_files(
                 detail=f"No {file_type} processed files found"
             )
         
-        # Create zip file with processed data
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Stream zip file with processed data
+        async def processed_entries():
             for file_info in files_to_download:
-                zip_file.writestr(file_info["filename"], file_info["text"])
-        
-        zip_buffer.seek(0)
+                yield file_info["filename"], file_info["text"], None
         
         logger.info(
             "download.processed.zip_created",
@@ -263,7 +420,7 @@ async def download_processed_files(
         )
         
         return StreamingResponse(
-            iter([zip_buffer.getvalue()]),
+            _stream_zip(processed_entries()),
             media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename=processed_{file_type}_files.zip"}
         )
@@ -284,6 +441,8 @@ async def download_all_files(
     hospital_id: Optional[str] = Query(None),
     job_id: Optional[str] = Query(None),
     session: AsyncSession = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+    minio_client: AsyncMinioClient = Depends(get_minio_client),
 ):
     """
     Download all files from MinIO (original + processed) in organized folder structure.
@@ -311,120 +470,97 @@ async def download_all_files(
     
     try:
         # Build query to find documents
-        stmt = select(Document)
-        if patient_id:
-            stmt = stmt.where(Document.patient_id == patient_id)
-        if hospital_id:
-            stmt = stmt.where(Document.hospital_id == hospital_id)
-        if job_id:
-            stmt = stmt.where(Document.job_id == job_id)
+        stmt = _filter_documents(lambda_stmt(lambda: select(Document)), patient_id, hospital_id, job_id)
+        
+        # Collect (zip path, MinIO path) pairs for every file first; the zip is then
+        # streamed while files are retrieved concurrently
+        files_to_zip: list[tuple[str, str]] = []
+        documents_count = 0
         
-        documents = (await session.scalars(stmt)).all()
+        # Documents are streamed through a server-side cursor
+        documents = await session.stream_scalars(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
         
-        if not documents:
+        async for doc in documents:
+            documents_count += 1
+            doc_id_short = doc.document_id[:8]
+            
+            # 1. Original file
+            if doc.original_file_path:
+                original_name = Path(doc.original_file_path).name
+                files_to_zip.append((f"original/{original_name}", doc.original_file_path))
+            
+            # 2. & 3. List the document's directory and its patient-centric results
+            # concurrently; all result types share one parent prefix:
+            # {hospital_id}/{patient_id}/results/{job_id}/{document_id}/{result_type}/
+            results_prefix = f"{doc.hospital_id}/{doc.patient_id}/results/{doc.job_id}/{doc.document_id}/"
+            directory_objects, result_objects = await _list_prefixes(minio_client, [doc.file_path, results_prefix])
+            
+            # All files from document's file_path directory, organized by folder in zip
+            for obj in directory_objects:
+                relative_path = obj.replace(doc.file_path, "").lstrip("/")
+                files_to_zip.append((f"processed/{doc_id_short}/{relative_path}", obj))
+            
+            # Bucket result files by their result type segment
+            results_by_type: dict[str, list[str]] = {result_type: [] for result_type in _RESULT_TYPES}
+            for obj in result_objects:
+                parts = obj.split("/")
+                if len(parts) > 6 and parts[5] in results_by_type:
+                    results_by_type[parts[5]].append(obj)
+            
+            if not result_objects:
+                # Legacy job-centric paths (fallback for old data)
+                legacy_objects = await _list_prefixes(
+                    minio_client,
+                    [f"{result_type}_results/{doc.job_id}/{doc.document_id}" for result_type in _RESULT_TYPES]
+                )
+                results_by_type = dict(zip(_RESULT_TYPES, legacy_objects))
+            
+            for result_type, objects in results_by_type.items():
+                for obj in objects:
+                    # Extract meaningful filename from path
+                    relative_path = obj.split("/")[-1]  # Just the filename
+                    files_to_zip.append((f"results/{result_type}/{doc_id_short}/{relative_path}", obj))
+        
+        if not documents_count:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No documents found matching the criteria"
             )
         
+        total_files = len(files_to_zip)
+        
         logger.info(
             "download.all.start",
             patient_id=patient_id,
             hospital_id=hospital_id,
             job_id=job_id,
-            documents_count=len(documents)
+            documents_count=documents_count
         )
         
-        # Create zip file with all files from MinIO
-        zip_buffer = io.BytesIO()
-        total_files = 0
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            
-            # Process each document
-            for doc in documents:
-                doc_id_short = doc.document_id[:8]
-                
-                # 1. Download original file
-                if doc.original_file_path:
-                    try:
-                        file_content = await storage_service.retrieve_file(doc.original_file_path)
-                        filename = f"original/{Path(doc.original_file_path).name}"
-                        zip_file.writestr(filename, file_content)
-                        total_files += 1
-                        logger.info("download.all.original_added", filename=filename)
-                    except Exception as e:
-                        logger.warning("download.all.original_file_error", file_path=doc.original_file_path, error=str(e))
-                
-                # 2. Download all files from document's file_path directory in MinIO
-                if doc.file_path:
-                    try:
-                        # List all objects in the document's directory
-                        objects = await minio_client.list_objects_in_directory(doc.file_path)
-                        
-                        for obj in objects:
-                            try:
-                                # Download each file
-                                file_content = await storage_service.retrieve_file(obj)
-                                # Organize by folder in zip
-                                relative_path = obj.replace(doc.file_path, "").lstrip("/")
-                                zip_path = f"processed/{doc_id_short}/{relative_path}"
-                                zip_file.writestr(zip_path, file_content)
-                                total_files += 1
-                                logger.info("download.all.file_added", zip_path=zip_path)
-                            except Exception as e:
-                                logger.warning("download.all.file_error", minio_path=obj, error=str(e))
-                    
-                    except Exception as e:
-                        logger.warning("download.all.directory_list_error", directory=doc.file_path, error=str(e))
-                
-                # 3. Download OCR/spellcheck/deid result files from MinIO
-                # New patient-centric structure: {hospital_id}/{patient_id}/results/{job_id}/{document_id}/{result_type}/
-                result_types = ["ocr", "spellcheck", "deid"]
-                
-                for result_type in result_types:
-                    # New patient-centric path
-                    patient_centric_prefix = f"{doc.hospital_id}/{doc.patient_id}/results/{doc.job_id}/{doc.document_id}/{result_type}"
-                    # Legacy job-centric path (fallback for old data)
-                    legacy_prefix = f"{result_type}_results/{doc.job_id}/{doc.document_id}"
-                    
-                    for prefix in [patient_centric_prefix, legacy_prefix]:
-                        try:
-                            objects = await minio_client.list_objects_in_directory(prefix)
-                            if not objects:
-                                continue
-                            
-                            for obj in objects:
-                                try:
-                                    file_content = await storage_service.retrieve_file(obj)
-                                    # Extract meaningful filename from path
-                                    relative_path = obj.split("/")[-1]  # Just the filename
-                                    zip_path = f"results/{result_type}/{doc_id_short}/{relative_path}"
-                                    zip_file.writestr(zip_path, file_content)
-                                    total_files += 1
-                                    logger.info("download.all.result_file_added", zip_path=zip_path)
-                                except Exception as e:
-                                    logger.warning("download.all.result_file_error", minio_path=obj, error=str(e))
-                            break  # Found files in this prefix, don't check fallback
-                        except Exception as e:
-                            logger.debug("download.all.result_prefix_not_found", prefix=prefix)
-        
-        zip_buffer.seek(0)
-        
         if total_files == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No files found in MinIO for the selected documents"
             )
         
+        async def all_entries():
+            async for zip_path, minio_path, file_content in _retrieve_files(storage_service, files_to_zip):
+                if isinstance(file_content, BaseException):
+                    logger.warning("download.all.file_error", minio_path=minio_path, error=str(file_content))
+                    continue
+                logger.info("download.all.file_added", zip_path=zip_path)
+                # Only text results are worth deflating; originals and page images are stored
+                compress_type = zipfile.ZIP_DEFLATED if zip_path.startswith("results/") else zipfile.ZIP_STORED
+                yield zip_path, file_content, compress_type
+        
         logger.info(
             "download.all.zip_created",
-            documents_count=len(documents),
+            documents_count=documents_count,
             total_files=total_files
         )
         
         return StreamingResponse(
-            iter([zip_buffer.getvalue()]),
+            _stream_zip(all_entries(), compresslevel=1),
             media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename=all_files_{total_files}.zip"}
         )
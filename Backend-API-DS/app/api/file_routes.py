@@ -1,20 +1,225 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, status, Query
-from fastapi.responses import StreamingResponse, Response
+import asyncio
+import hashlib
+from functools import partial
+
+from fastapi import APIRouter, Header, HTTPException, status, Query
+from fastapi.responses import Response, StreamingResponse
 import io
 from PIL import Image
 
+from app.config.settings import get_settings
 from app.services.storage_service import get_storage_service
+from app.utils.etag import etag_matches
 from app.utils.logger import get_logger
+from app.utils.redis_client import get_redis_client
+
+try:  # libjpeg-turbo is optional; Pillow's JPEG codec is the fallback
+    import numpy as np
+    from turbojpeg import TJFLAG_PROGRESSIVE, TJPF_RGB, TJSAMP_420, TurboJPEG
+    _turbo_jpeg: TurboJPEG | None = TurboJPEG(get_settings().turbojpeg_lib_path)
+except (ImportError, OSError, RuntimeError):  # package or shared library missing
+    _turbo_jpeg = None
 
 router = APIRouter(prefix="/files", tags=["files"])
 logger = get_logger(__name__)
 storage_service = get_storage_service()
+settings = get_settings()
+redis_client = get_redis_client()
+
+# Total bytes of encoded thumbnails kept per worker
+_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+_JPEG_MAGIC = b"\xff\xd8\xff"
+
+# Content types served by get_image, by lowercase file extension
+_IMAGE_CONTENT_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "pdf": "application/pdf",
+}
+
+# Thumbnails wider than this are resized with Lanczos; smaller ones use bilinear
+_LANCZOS_MIN_WIDTH = 300
+
+# Highest thumbnail quality served to clients that send Save-Data: on
+_SAVE_DATA_MAX_QUALITY = 60
+
+
+class _ThumbnailCache:
+    """
+    In-memory LRU cache of encoded thumbnails, bounded by total size in bytes.
+
+    Only used from the event loop thread. No method awaits, so every lookup,
+    insert and eviction runs to completion without another coroutine seeing
+    the cache half-updated, and no lock is needed.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.currsize = 0
+        # Plain dicts keep insertion order; most recently used entries sit at the end
+        self._entries: dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._entries[key] = data
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.currsize -= len(previous)
+        self._entries[key] = data
+        self.currsize += len(data)
+        # Evict least recently used entries until back under budget
+        while self.currsize > self.max_bytes:
+            evicted = self._entries.pop(next(iter(self._entries)))
+            self.currsize -= len(evicted)
+
+
+_thumbnail_cache = _ThumbnailCache(_CACHE_MAX_BYTES)
+
+# Thumbnail generations in progress on this worker, by cache key
+_inflight_thumbnails: dict[str, asyncio.Future[bytes]] = {}
+
+# Key prefix for thumbnails shared across workers through Redis
+_SHARED_CACHE_PREFIX = "thumbnail:"
+
+
+async def _get_shared_thumbnail(cache_key: str) -> bytes | None:
+    """Look up a thumbnail generated by any worker; cache failures count as a miss."""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(_SHARED_CACHE_PREFIX + cache_key)
+    except Exception as e:
+        logger.warning("file.thumbnail_shared_cache_error", error=str(e))
+        return None
+
+
+async def _put_shared_thumbnail(cache_key: str, thumbnail_bytes: bytes) -> None:
+    """Publish a generated thumbnail to the shared cache, keeping any existing copy."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(
+            _SHARED_CACHE_PREFIX + cache_key,
+            thumbnail_bytes,
+            ex=settings.thumbnail_cache_ttl_seconds,
+            nx=True,
+        )
+    except Exception as e:
+        logger.warning("file.thumbnail_shared_cache_error", error=str(e))
+
+
+def _open_image(file_content: bytes, target_width: int) -> Image.Image:
+    """
+    Decode an image, using libjpeg-turbo directly for JPEG sources when available.
+    JPEGs are decoded at a reduced DCT scale that still leaves at least twice
+    `target_width` pixels, which skips most of the IDCT work for large scans.
+    """
+    if _turbo_jpeg is not None and file_content.startswith(_JPEG_MAGIC):
+        try:
+            source_width = _turbo_jpeg.decode_header(file_content)[0]
+            scaling_factor = min(
+                (
+                    factor for factor in _turbo_jpeg.scaling_factors
+                    if factor[0] <= factor[1] and source_width * factor[0] // factor[1] >= target_width * 2
+                ),
+                key=lambda factor: factor[0] / factor[1],
+                default=None,
+            )
+            return Image.fromarray(
+                _turbo_jpeg.decode(file_content, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+            )
+        except OSError as e:
+            # e.g. CMYK/YCCK JPEGs that libjpeg-turbo cannot decode to RGB; Pillow can
+            logger.warning("file.turbojpeg_decode_failed", error=str(e))
+    img = Image.open(io.BytesIO(file_content))
+    # No-op for formats other than JPEG; only the width constrains the reduction
+    img.draft('RGB', (target_width * 2, 1))
+    return img
+
+
+def _encode_jpeg(img: Image.Image, quality: int, optimize: bool) -> bytes:
+    """Encode an RGB image as progressive JPEG; optimize adds Pillow's second Huffman pass."""
+    if _turbo_jpeg is not None and not optimize:
+        return _turbo_jpeg.encode(
+            np.asarray(img),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+            flags=TJFLAG_PROGRESSIVE,
+        )
+    buffer = io.BytesIO()
+    img.save(buffer, format='JPEG', quality=quality, optimize=optimize, progressive=True)
+    return buffer.getvalue()
+
+
+def _render_thumbnail(file_content: bytes, width: int, quality: int, optimize: bool) -> bytes:
+    """Decode an image, scale it to `width` keeping the aspect ratio, and encode it as JPEG."""
+    # Open image and create thumbnail
+    img = _open_image(file_content, width)
+    
+    # Convert to RGB if necessary (for PNG with transparency)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    # Downsample to the target width in place, maintaining aspect ratio. After the
+    # reduced-scale decode, bilinear is indistinguishable from Lanczos at small sizes
+    resample = Image.Resampling.LANCZOS if width > _LANCZOS_MIN_WIDTH else Image.Resampling.BILINEAR
+    img.thumbnail((width, 10_000), resample)
+    
+    # Encode as JPEG
+    return _encode_jpeg(img, quality, optimize)
+
+
+def _forget_generation(cache_key: str, generation: asyncio.Future[bytes]) -> None:
+    _inflight_thumbnails.pop(cache_key, None)
+    # Mark a failure as retrieved even if every waiting request has gone away
+    if not generation.cancelled():
+        generation.exception()
+
 
-# In-memory thumbnail cache (simple LRU-like behavior)
-_thumbnail_cache: dict[str, bytes] = {}
-_CACHE_MAX_SIZE = 100
+async def _generate_thumbnail(path: str, cache_key: str, width: int, quality: int, optimize: bool) -> bytes:
+    """Build a thumbnail from the original in MinIO and store it in both caches."""
+    # Retrieve original file from MinIO
+    file_content = await storage_service.retrieve_file(path)
+    
+    # Decode, resize and encode are CPU-bound; Pillow and libjpeg-turbo release the
+    # GIL, so a worker thread keeps the event loop responsive
+    thumbnail_bytes = await asyncio.to_thread(_render_thumbnail, file_content, width, quality, optimize)
+    
+    # Cache the result
+    _thumbnail_cache.put(cache_key, thumbnail_bytes)
+    await _put_shared_thumbnail(cache_key, thumbnail_bytes)
+    
+    logger.info(
+        "file.thumbnail_generated",
+        path=path,
+        width=width,
+        size=len(thumbnail_bytes),
+        cache_entries=len(_thumbnail_cache),
+        cache_bytes=_thumbnail_cache.currsize,
+    )
+    return thumbnail_bytes
 
 
 @router.get("/thumbnail")
@@ -22,6 +227,9 @@ async def get_thumbnail(
     path: str = Query(..., description="MinIO path to the image file"),
     width: int = Query(200, ge=50, le=400, description="Thumbnail width"),
     quality: int = Query(70, ge=30, le=95, description="JPEG quality"),
+    optimize: bool = Query(False, description="Optimize Huffman tables (slower, slightly smaller)"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+    save_data: str | None = Header(None, alias="Save-Data"),
 ):
     """
     Get a thumbnail version of an image (much smaller file size).
@@ -30,8 +238,10 @@ async def get_thumbnail(
     - path: The full MinIO path to the image file
     - width: Target width (height auto-calculated to maintain aspect ratio)
     - quality: JPEG quality (lower = smaller file)
+    - optimize: Spend a second encoding pass for a few percent smaller output
     
-    Returns a compressed JPEG thumbnail.
+    Returns a compressed progressive JPEG thumbnail. Quality is capped for
+    clients that send `Save-Data: on`.
     """
     if not path:
         raise HTTPException(
@@ -39,60 +249,65 @@ async def get_thumbnail(
             detail="Path parameter is required"
         )
     
-    # Check cache first
-    cache_key = f"{path}:{width}:{quality}"
-    if cache_key in _thumbnail_cache:
+    if save_data and save_data.strip().lower() == "on":
+        quality = min(quality, _SAVE_DATA_MAX_QUALITY)
+    
+    # The original's MinIO ETag keys the cache and the thumbnail ETag, so an
+    # overwritten image gets a new thumbnail; a missing one is a 404 here
+    try:
+        size, object_etag = await storage_service.stat_file(path)
+    except Exception as e:
+        logger.error("file.thumbnail_error", path=path, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File not found or cannot generate thumbnail: {path}"
+        )
+    cache_key = f"{path}:{object_etag or size}:{width}:{quality}:{int(optimize)}"
+    
+    # The client already has this thumbnail
+    etag = _thumbnail_etag(cache_key)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"Cache-Control": "public, max-age=86400", "ETag": etag, "Vary": "Save-Data"},
+        )
+    
+    # Check this worker's cache first, then the cache shared across workers
+    cached = _thumbnail_cache.get(cache_key)
+    if cached is None:
+        cached = await _get_shared_thumbnail(cache_key)
+        if cached is not None:
+            _thumbnail_cache.put(cache_key, cached)
+    if cached is not None:
         return Response(
-            content=_thumbnail_cache[cache_key],
+            content=cached,
             media_type="image/jpeg",
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+                "ETag": etag,
+                "Vary": "Save-Data",
                 "X-Cache": "HIT",
             }
         )
     
+    # Concurrent requests for the same uncached thumbnail share one generation
+    generation = _inflight_thumbnails.get(cache_key)
+    if generation is None:
+        generation = asyncio.ensure_future(_generate_thumbnail(path, cache_key, width, quality, optimize))
+        _inflight_thumbnails[cache_key] = generation
+        generation.add_done_callback(partial(_forget_generation, cache_key))
+    
     try:
-        # Retrieve original file from MinIO
-        file_content = await storage_service.retrieve_file(path)
-        
-        # Open image and create thumbnail
-        img = Image.open(io.BytesIO(file_content))
-        
-        # Convert to RGB if necessary (for PNG with transparency)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # Calculate new height maintaining aspect ratio
-        aspect_ratio = img.height / img.width
-        new_height = int(width * aspect_ratio)
-        
-        # Resize using high-quality downsampling
-        img = img.resize((width, new_height), Image.Resampling.LANCZOS)
-        
-        # Save as JPEG to buffer
-        buffer = io.BytesIO()
-        img.save(buffer, format='JPEG', quality=quality, optimize=True)
-        thumbnail_bytes = buffer.getvalue()
-        
-        # Cache the result
-        if len(_thumbnail_cache) >= _CACHE_MAX_SIZE:
-            # Remove oldest entry (simple approach)
-            _thumbnail_cache.pop(next(iter(_thumbnail_cache)))
-        _thumbnail_cache[cache_key] = thumbnail_bytes
-        
-        logger.info("file.thumbnail_generated", path=path, width=width, size=len(thumbnail_bytes))
+        # Shielded so a disconnecting client does not cancel the work for the others
+        thumbnail_bytes = await asyncio.shield(generation)
         
         return Response(
             content=thumbnail_bytes,
             media_type="image/jpeg",
             headers={
                 "Cache-Control": "public, max-age=86400",
+                "ETag": etag,
+                "Vary": "Save-Data",
                 "X-Cache": "MISS",
             }
         )
@@ -105,9 +320,79 @@ async def get_thumbnail(
         )
 
 
+def _thumbnail_etag(cache_key: str) -> str:
+    """Thumbnails are derived deterministically from the original (its MinIO ETag) and parameters."""
+    return f'W/"{hashlib.blake2b(cache_key.encode(), digest_size=8).hexdigest()}"'
+
+
+def _parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single `bytes=start-end` Range header into an inclusive (start, end) pair.
+    Returns None when the whole file should be sent; raises 416 when unsatisfiable.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    start_text, _, end_text = range_header[6:].strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(size - int(end_text), 0), size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,  # Range Not Satisfiable
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+async def _stream_file(
+    path: str,
+    media_type: str,
+    headers: dict[str, str],
+    range_header: str | None,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Stream a MinIO object to the client, honouring a single byte Range request.
+    Answers 304 without touching the object body when the client's ETag still matches.
+    """
+    size, object_etag = await storage_service.stat_file(path)
+    headers = {**headers, "Accept-Ranges": "bytes"}
+    if object_etag:
+        etag = f'"{object_etag}"'
+        headers["ETag"] = etag
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    byte_range = _parse_range(range_header, size)
+    
+    if byte_range is None:
+        body = await storage_service.open_stream(path)
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(body, media_type=media_type, headers=headers)
+    
+    start, end = byte_range
+    body = await storage_service.open_stream(path, offset=start, length=end - start + 1)
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        body,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
 @router.get("/image")
 async def get_image(
     path: str = Query(..., description="MinIO path to the image file"),
+    range_header: str | None = Header(None, alias="Range"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
 ):
     """
     Retrieve an image file from MinIO storage.
@@ -129,29 +414,23 @@ async def get_image(
     try:
         logger.info("file.get_image", path=path)
         
-        # Retrieve file from MinIO
-        file_content = await storage_service.retrieve_file(path)
-        
-        # Determine content type based on file extension
-        content_type = "image/png"
-        if path.lower().endswith(".jpg") or path.lower().endswith(".jpeg"):
-            content_type = "image/jpeg"
-        elif path.lower().endswith(".gif"):
-            content_type = "image/gif"
-        elif path.lower().endswith(".webp"):
-            content_type = "image/webp"
-        elif path.lower().endswith(".pdf"):
-            content_type = "application/pdf"
+        # Determine content type based on file extension (PNG by default)
+        content_type = _IMAGE_CONTENT_TYPES.get(path.rpartition(".")[2].lower(), "image/png")
         
-        return StreamingResponse(
-            io.BytesIO(file_content),
-            media_type=content_type,
-            headers={
+        # Stream the file from MinIO
+        return await _stream_file(
+            path,
+            content_type,
+            {
                 "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
                 "Content-Disposition": f"inline; filename={path.split('/')[-1]}",
-            }
+            },
+            range_header,
+            if_none_match,
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("file.get_image_error", path=path, error=str(e))
         raise HTTPException(
@@ -163,6 +442,7 @@ async def get_image(
 @router.get("/download")
 async def download_file(
     path: str = Query(..., description="MinIO path to the file"),
+    range_header: str | None = Header(None, alias="Range"),
 ):
     """
     Download a file from MinIO storage.
@@ -170,7 +450,8 @@ async def download_file(
     Query Parameters:
     - path: The full MinIO path to the file
     
-    Returns the file as an attachment download.
+    Returns the file as an attachment download. Single byte ranges (Range header)
+    are supported for resumable downloads.
     """
     if not path:
         raise HTTPException(
@@ -181,19 +462,18 @@ async def download_file(
     try:
         logger.info("file.download", path=path)
         
-        # Retrieve file from MinIO
-        file_content = await storage_service.retrieve_file(path)
-        
         filename = path.split('/')[-1]
         
-        return StreamingResponse(
-            io.BytesIO(file_content),
-            media_type="application/octet-stream",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-            }
+        # Stream the file from MinIO
+        return await _stream_file(
+            path,
+            "application/octet-stream",
+            {"Content-Disposition": f"attachment; filename={filename}"},
+            range_header,
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("file.download_error", path=path, error=str(e))
         raise HTTPException(
@@ -3,8 +3,8 @@ from __future__ import annotations
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
@@ -27,6 +27,8 @@ class HospitalCreate(BaseModel):
 
 class HospitalResponse(BaseModel):
     """Schema for hospital response."""
+    model_config = ConfigDict(from_attributes=True)
+
     hospital_id: str
     name: str
     code: str
@@ -71,15 +73,7 @@ async def create_hospital(
 
     logger.info("hospital.created", hospital_id=hospital.hospital_id, code=data.code)
 
-    return HospitalResponse(
-        hospital_id=hospital.hospital_id,
-        name=hospital.name,
-        code=hospital.code,
-        address=hospital.address,
-        is_active=hospital.is_active,
-        created_at=hospital.created_at,
-        updated_at=hospital.updated_at,
-    )
+    return HospitalResponse.model_validate(hospital)
 
 
 @router.get("", response_model=HospitalsListResponse)
@@ -91,31 +85,21 @@ async def list_hospitals(
 ) -> HospitalsListResponse:
     """List all hospitals."""
     query = select(Hospital)
+    count_query = select(func.count()).select_from(Hospital)
     
     if is_active is not None:
         query = query.where(Hospital.is_active == is_active)
+        count_query = count_query.where(Hospital.is_active == is_active)
 
     # Get total count
-    all_hospitals = (await session.scalars(query)).all()
-    total = len(all_hospitals)
+    total = await session.scalar(count_query)
 
     # Get paginated results
     query = query.order_by(Hospital.name).limit(limit).offset(offset)
     hospitals = (await session.scalars(query)).all()
 
-    return HospitalsListResponse(
-        hospitals=[
-            HospitalResponse(
-                hospital_id=h.hospital_id,
-                name=h.name,
-                code=h.code,
-                address=h.address,
-                is_active=h.is_active,
-                created_at=h.created_at,
-                updated_at=h.updated_at,
-            )
-            for h in hospitals
-        ],
+    return HospitalsListResponse.model_construct(
+        hospitals=[HospitalResponse.model_validate(h) for h in hospitals],
         total=total,
     )
 
@@ -134,12 +118,4 @@ async def get_hospital(
             detail="Hospital not found",
         )
 
-    return HospitalResponse(
-        hospital_id=hospital.hospital_id,
-        name=hospital.name,
-        code=hospital.code,
-        address=hospital.address,
-        is_active=hospital.is_active,
-        created_at=hospital.created_at,
-        updated_at=hospital.updated_at,
-    )
+    return HospitalResponse.model_validate(hospital)
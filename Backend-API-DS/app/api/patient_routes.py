@@ -29,41 +29,13 @@ async def create_patient(
 ) -> PatientResponse:
     """Create a new patient."""
     patient_service = get_patient_service()
-    # Check if patient with this MRN already exists
-    existing = await patient_service.get_patient_by_mrn(
+    # Upsert on (hospital_id, MRN): an existing patient is returned as-is
+    patient = await patient_service.create_patient(
         session=session,
         hospital_id=current_user.hospital_id,
-        medical_record_number=data.medical_record_number,
-    )
-    
-    if existing:
-        patient = existing
-    else:
-        patient = await patient_service.create_patient(
-            session=session,
-            hospital_id=current_user.hospital_id,
-            data=data,
-        )
-
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to create patient",
-        )
-
-    return PatientResponse(
-        patient_id=patient.patient_id,
-        hospital_id=patient.hospital_id,
-        medical_record_number=patient.medical_record_number,
-        full_name=patient.full_name,
-        date_of_birth=patient.date_of_birth,
-        gender=patient.gender,
-        contact_number=patient.contact_number,
-        email=patient.email,
-        address=patient.address,
-        created_at=patient.created_at,
-        updated_at=patient.updated_at,
+        data=data,
     )
+    return PatientResponse.model_validate(patient)
 
 
 @router.get("", response_model=PatientsListResponse)
@@ -85,23 +57,8 @@ async def list_patients(
         offset=offset,
     )
 
-    return PatientsListResponse(
-        patients=[
-            PatientResponse(
-                patient_id=p.patient_id,
-                hospital_id=p.hospital_id,
-                medical_record_number=p.medical_record_number,
-                full_name=p.full_name,
-                date_of_birth=p.date_of_birth,
-                gender=p.gender,
-                contact_number=p.contact_number,
-                email=p.email,
-                address=p.address,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-            for p in patients
-        ],
+    return PatientsListResponse.model_construct(
+        patients=[PatientResponse.model_validate(p) for p in patients],
         total=total,
     )
 
@@ -127,19 +84,7 @@ async def get_patient_by_mrn(
             detail="Patient not found",
         )
 
-    return PatientResponse(
-        patient_id=patient.patient_id,
-        hospital_id=patient.hospital_id,
-        medical_record_number=patient.medical_record_number,
-        full_name=patient.full_name,
-        date_of_birth=patient.date_of_birth,
-        gender=patient.gender,
-        contact_number=patient.contact_number,
-        email=patient.email,
-        address=patient.address,
-        created_at=patient.created_at,
-        updated_at=patient.updated_at,
-    )
+    return PatientResponse.model_validate(patient)
 
 
 @router.get("/{patient_id}", response_model=PatientResponse)
@@ -163,19 +108,7 @@ async def get_patient(
             detail="Patient not found",
         )
 
-    return PatientResponse(
-        patient_id=patient.patient_id,
-        hospital_id=patient.hospital_id,
-        medical_record_number=patient.medical_record_number,
-        full_name=patient.full_name,
-        date_of_birth=patient.date_of_birth,
-        gender=patient.gender,
-        contact_number=patient.contact_number,
-        email=patient.email,
-        address=patient.address,
-        created_at=patient.created_at,
-        updated_at=patient.updated_at,
-    )
+    return PatientResponse.model_validate(patient)
 
 
 @router.patch("/{patient_id}", response_model=PatientResponse)
@@ -201,19 +134,7 @@ async def update_patient(
             detail="Patient not found",
         )
 
-    return PatientResponse(
-        patient_id=patient.patient_id,
-        hospital_id=patient.hospital_id,
-        medical_record_number=patient.medical_record_number,
-        full_name=patient.full_name,
-        date_of_birth=patient.date_of_birth,
-        gender=patient.gender,
-        contact_number=patient.contact_number,
-        email=patient.email,
-        address=patient.address,
-        created_at=patient.created_at,
-        updated_at=patient.updated_at,
-    )
+    return PatientResponse.model_validate(patient)
 
 
 @router.delete("/{patient_id}", status_code=status.HTTP_204_NO_CONTENT)
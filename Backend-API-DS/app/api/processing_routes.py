@@ -21,5 +21,5 @@ async def process_job(
         await processing_service.start_job(session, job_id)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    return ProcessResponse(jobId=job_id, message="Processing started")
+    return ProcessResponse.model_construct(jobId=job_id, message="Processing started")
 
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from itertools import groupby
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import String, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
+import orjson
 
 from app.db.models.document import Document
 from app.db.models.document_page import DocumentPage
 from app.db.models.job import Job
+from app.db.models.ocr_deidentified_text import OcrDeidentifiedText
 from app.db.models.ocr_raw_text import OcrRawText
 from app.db.models.ocr_spellchecked_text import OcrSpellcheckedText
-from app.db.models.ocr_deidentified_text import OcrDeidentifiedText
 from app.db.session import get_db_session
-from app.schemas.result_schema import ResultResponse, ExtractionEntry, DocumentResult, EntityInfo, PageValidationRequest
+from app.schemas.result_schema import ResultResponse, PageValidationRequest
 from app.services.pipeline_service import get_pipeline_service
 from app.utils.logger import get_logger
 
@@ -20,98 +23,112 @@ router = APIRouter(prefix="/result", tags=["result"])
 logger = get_logger(__name__)
 
 
-@router.get("/{job_id}", response_model=ResultResponse)
-async def job_result(job_id: str, session: AsyncSession = Depends(get_db_session)) -> ResultResponse:
+def _entity_payload(entity: dict) -> dict:
+    """Entity as exposed by the API; the pipeline stores the type under `entity_type`."""
+    return {
+        "type": entity.get("type", entity.get("entity_type")),
+        "start": entity.get("start"),
+        "end": entity.get("end"),
+        "score": entity.get("score"),
+        "text": entity.get("text"),
+    }
+
+
+async def _build_result_payload(job_id: str, session: AsyncSession) -> dict:
     """
-    Retrieve comprehensive pipeline results for a job.
-    
-    Returns JSON format with:
-    - job_id, status, timestamps
-    - documents with all pages
-    - each page with OCR, spell check, and de-identification results
-    - entity information for de-identified content
+    Collect a job's documents, pages and pipeline outputs as a plain dict shaped
+    like ResultResponse.
     """
     job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     documents = (await session.scalars(select(Document).where(Document.job_id == job_id))).all()
-    document_payload: list[DocumentResult] = []
+    document_payload: list[dict] = []
+    
+    # Use actual image path from database (set during pipeline processing), falling
+    # back to the conventional location under the document's directory
+    image_path = func.coalesce(
+        DocumentPage.image_minio_path,
+        Document.file_path + "/page_" + cast(DocumentPage.page_number, String) + ".png",
+    ).label("image_path")
+    
+    # Load every page of the job with its image path and its OCR, spell check and
+    # de-identification results as pre-joined rows in a single round trip; each
+    # result table holds at most one row per page
+    rows = (
+        await session.execute(
+            select(DocumentPage, image_path, OcrRawText, OcrSpellcheckedText, OcrDeidentifiedText)
+            .join(Document, Document.document_id == DocumentPage.document_id)
+            .outerjoin(OcrRawText, OcrRawText.page_id == DocumentPage.page_id)
+            .outerjoin(OcrSpellcheckedText, OcrSpellcheckedText.page_id == DocumentPage.page_id)
+            .outerjoin(OcrDeidentifiedText, OcrDeidentifiedText.page_id == DocumentPage.page_id)
+            .where(DocumentPage.document_id.in_([doc.document_id for doc in documents]))
+            .order_by(DocumentPage.document_id, DocumentPage.page_number)
+        )
+    ).all()
+    # Rows arrive ordered by document, so each document's pages are one contiguous run
+    pages_by_document = {
+        document_id: list(page_rows)
+        for document_id, page_rows in groupby(rows, key=lambda row: row[0].document_id)
+    }
     
     for doc in documents:
-        pages = (
-            await session.scalars(
-                select(DocumentPage)
-                .where(DocumentPage.document_id == doc.document_id)
-                .order_by(DocumentPage.page_number)
-            )
-        ).all()
-        
         extraction_entries = []
-        for page in pages:
-            raw = await session.scalar(select(OcrRawText).where(OcrRawText.page_id == page.page_id))
-            spellchecked = await session.scalar(
-                select(OcrSpellcheckedText).where(OcrSpellcheckedText.page_id == page.page_id)
-            )
-            deid = await session.scalar(
-                select(OcrDeidentifiedText).where(OcrDeidentifiedText.page_id == page.page_id)
-            )
-            
-            # Use actual image path from database (set during pipeline processing)
-            image_path = page.image_minio_path or f"{doc.file_path}/page_{page.page_number}.png"
-            
-            # Default values
-            ocr_metadata = None
-            spellcheck_metadata = None
-            deid_metadata = None
-            entities_found = None
-            entities_count = None
-            
-            # Parse metadata if available (stored as JSON in the result)
-            # Note: In production, store metadata as separate JSON fields or in MinIO
-            
-            # Get metadata from database
-            ocr_metadata = raw.result_metadata if raw else None
-            spellcheck_metadata = spellchecked.result_metadata if spellchecked else None
-            deid_metadata = deid.result_metadata if deid else None
+        for page, page_image_path, raw, spellchecked, deid in pages_by_document.get(doc.document_id, ()):
             entities_found = deid.entities_found if deid else None
-            entities_count = deid.entities_count if deid else None
             
-            extraction_entry = ExtractionEntry(
-                page_id=page.page_id,
-                page_number=page.page_number,
-                image_path=image_path,
-                extracted_text=raw.raw_text if raw else "",
-                spellchecked_text=spellchecked.spellchecked_text if spellchecked else "",
-                deid_text=deid.deid_text if deid else "",
-                corrected_deid=deid.corrected_deid if deid else None,
-                is_validated=deid.is_validated if deid else False,
-                ocr_metadata=ocr_metadata,
-                spellcheck_metadata=spellcheck_metadata,
-                deid_metadata=deid_metadata,
-                entities_found=entities_found,
-                entities_count=entities_count,
-            )
-            extraction_entries.append(extraction_entry)
+            extraction_entries.append({
+                "page_id": page.page_id,
+                "page_number": page.page_number,
+                "image_path": page_image_path,
+                "extracted_text": raw.raw_text if raw else "",
+                "spellchecked_text": spellchecked.spellchecked_text if spellchecked else "",
+                "deid_text": deid.deid_text if deid else "",
+                "corrected_deid": deid.corrected_deid if deid else None,
+                "is_validated": deid.is_validated if deid else False,
+                # Metadata stored as JSON alongside each result in the database
+                "ocr_metadata": raw.result_metadata if raw else None,
+                "spellcheck_metadata": spellchecked.result_metadata if spellchecked else None,
+                "deid_metadata": deid.result_metadata if deid else None,
+                "entities_found": (
+                    [_entity_payload(entity) for entity in entities_found]
+                    if entities_found is not None else None
+                ),
+                "entities_count": deid.entities_count if deid else None,
+            })
         
-        document_result = DocumentResult(
-            doc_id=doc.document_id,
-            original_file_path=doc.original_file_path,
-            patient_id=doc.patient_id,
-            hospital_id=doc.hospital_id,
-            doc_type=doc.doc_type,
-            total_pages=len(extraction_entries),
-            extraction=extraction_entries,
-        )
-        document_payload.append(document_result)
+        document_payload.append({
+            "doc_id": doc.document_id,
+            "original_file_path": doc.original_file_path,
+            "patient_id": doc.patient_id,
+            "hospital_id": doc.hospital_id,
+            "doc_type": doc.doc_type,
+            "total_pages": len(extraction_entries),
+            "extraction": extraction_entries,
+        })
 
-    return ResultResponse(
-        job_id=job.job_id,
-        status=job.status,
-        created_at=job.created_at.isoformat() if job.created_at else None,
-        updated_at=job.updated_at.isoformat() if job.updated_at else None,
-        document=document_payload
-    )
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "document": document_payload,
+    }
+
+
+@router.get("/{job_id}", response_model=ResultResponse)
+async def job_result(job_id: str, session: AsyncSession = Depends(get_db_session)) -> ResultResponse:
+    """
+    Retrieve comprehensive pipeline results for a job.
+    
+    Returns JSON format with:
+    - job_id, status, timestamps
+    - documents with all pages
+    - each page with OCR, spell check, and de-identification results
+    - entity information for de-identified content
+    """
+    return ResultResponse.model_validate(await _build_result_payload(job_id, session))
 
 
 @router.post("/page/{page_id}/validate")
@@ -134,11 +151,12 @@ async def validate_page(
 
 
 @router.get("/{job_id}/json")
-async def job_result_json(job_id: str, session: AsyncSession = Depends(get_db_session)) -> dict:
+async def job_result_json(job_id: str, session: AsyncSession = Depends(get_db_session)) -> Response:
     """
     Retrieve pipeline results as raw JSON format.
     Useful for direct API consumption without Pydantic validation.
     """
-    result = await job_result(job_id, session)
-    return result.model_dump()
+    # Built without the ResultResponse round trip and returned directly, so the dict
+    # is serialized by orjson without a jsonable_encoder pass
+    return Response(orjson.dumps(await _build_result_payload(job_id, session)), media_type="application/json")
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import Row, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.document import Document
@@ -15,43 +16,96 @@ from app.db.models.ocr_raw_text import OcrRawText
 from app.db.models.ocr_spellchecked_text import OcrSpellcheckedText
 from app.db.session import get_db_session
 from app.schemas.process_schema import FileStageStatus, StatusResponse
-from app.services.pipeline_service import get_pipeline_service
+from app.services.pipeline_service import PipelineService, get_pipeline_service
+from app.utils.etag import etag_matches
 
 router = APIRouter(prefix="/status", tags=["status"])
-pipeline_service = get_pipeline_service()
+
+# Status polls are the hottest queries in the API; both statements are built once
+# and bound per request so every poll hits SQLAlchemy's compiled-statement cache
+
+# Job status with the markers that change whenever its visible progress does
+_PROGRESS_MARKER = (
+    select(
+        Job.status,
+        Job.updated_at,
+        func.max(Document.updated_at),
+        func.count(Document.document_id),
+    )
+    .outerjoin(Document, Document.job_id == Job.job_id)
+    .where(Job.job_id == bindparam("job_id"))
+    .group_by(Job.job_id)
+)
+
+# Page and per-stage result counts per document; each result table holds at most
+# one row per page, so plain counts over the outer joins need no DISTINCT
+_JOB_PROGRESS = (
+    select(
+        Job.status,
+        Document.document_id,
+        Document.original_file_path,
+        func.count(DocumentPage.page_id).label("total_pages"),
+        func.count(OcrRawText.page_id).label("ocr_pages"),
+        func.count(OcrSpellcheckedText.page_id).label("spell_pages"),
+        func.count(OcrDeidentifiedText.page_id).label("deid_pages"),
+    )
+    .select_from(Job)
+    .outerjoin(Document, Document.job_id == Job.job_id)
+    .outerjoin(DocumentPage, DocumentPage.document_id == Document.document_id)
+    .outerjoin(OcrRawText, OcrRawText.page_id == DocumentPage.page_id)
+    .outerjoin(OcrSpellcheckedText, OcrSpellcheckedText.page_id == DocumentPage.page_id)
+    .outerjoin(OcrDeidentifiedText, OcrDeidentifiedText.page_id == DocumentPage.page_id)
+    .where(Job.job_id == bindparam("job_id"))
+    .group_by(Job.job_id, Document.document_id)
+    .order_by(Document.created_at, Document.document_id)
+)
 
 
 @router.get("/{job_id}", response_model=StatusResponse)
-async def job_status(job_id: str, session: AsyncSession = Depends(get_db_session)) -> StatusResponse:
-    job = await session.get(Job, job_id)
-    if not job:
+async def job_status(
+    job_id: str,
+    response: Response,
+    session: AsyncSession = Depends(get_db_session),
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+) -> StatusResponse | Response:
+    # Cheap probe of the job's progress markers; unchanged markers mean an
+    # unchanged response, so polls that already have it skip the aggregation
+    marker = (await session.execute(_PROGRESS_MARKER, {"job_id": job_id})).first()
+    if marker is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    job_status = marker[0]
+
+    if job_status in (JobStatusEnum.PENDING.value, JobStatusEnum.PROCESSING.value):
+        await pipeline_service.ensure_started(job_id)
+
+    etag = _progress_etag(marker)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
 
-    if job.status == JobStatusEnum.PENDING.value:
-        await pipeline_service.ensure_started(job.job_id)
+    if job_status == JobStatusEnum.PENDING.value:
         return StatusResponse(
-            job_id=job.job_id,
+            job_id=job_id,
             status="Starting",
             message="Initializing processing...",
         )
 
-    if job.status == JobStatusEnum.PROCESSING.value:
-        await pipeline_service.ensure_started(job.job_id)
+    rows = await _load_job_progress(session, job_id)
+    files, progress = _summarize_progress(rows)
 
-    files, progress = await _gather_progress(session, job.job_id)
-
-    status_label = _format_status(job.status)
-    if job.status == JobStatusEnum.PROCESSING.value:
+    status_label = _format_status(job_status)
+    if job_status == JobStatusEnum.PROCESSING.value:
         return StatusResponse(
-            job_id=job.job_id,
+            job_id=job_id,
             status=status_label,
             overall_progress=f"{progress:.0f}%",
             files=files,
         )
 
-    if job.status == JobStatusEnum.COMPLETED.value:
+    if job_status == JobStatusEnum.COMPLETED.value:
         return StatusResponse(
-            job_id=job.job_id,
+            job_id=job_id,
             status=status_label,
             overall_progress="100%",
             files=files,
@@ -59,52 +113,48 @@ async def job_status(job_id: str, session: AsyncSession = Depends(get_db_session
         )
 
     return StatusResponse(
-        job_id=job.job_id,
-        status=status_label if job.status != JobStatusEnum.FAILED.value else "Failed",
+        job_id=job_id,
+        status=status_label if job_status != JobStatusEnum.FAILED.value else "Failed",
         message="Processing failed. Please retry the job.",
         files=files,
     )
 
 
-async def _gather_progress(session: AsyncSession, job_id: str) -> tuple[List[FileStageStatus], float]:
-    documents = (await session.scalars(select(Document).where(Document.job_id == job_id))).all()
-    total_stage_slots = max(len(documents) * 3, 1)
+async def _load_job_progress(session: AsyncSession, job_id: str) -> Sequence[Row]:
+    """
+    Job status with page and per-stage result counts for each of its documents,
+    in one round trip. Returns one row per document (a single row with a NULL
+    document_id when the job has none), or no rows when the job does not exist.
+    """
+    return (await session.execute(_JOB_PROGRESS, {"job_id": job_id})).all()
+
+
+def _progress_etag(marker: Row) -> str:
+    """
+    Pages and stage results of a document only become visible when the pipeline
+    commits the document's new status, which bumps its updated_at; the job's own
+    status changes bump the job's. Together they identify the status response.
+    """
+    key = "|".join(str(value) for value in marker)
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
+def _summarize_progress(rows: Sequence[Row]) -> tuple[List[FileStageStatus], float]:
+    rows = [row for row in rows if row.document_id is not None]
+    total_stage_slots = max(len(rows) * 3, 1)
     completed_slots = 0
     files: List[FileStageStatus] = []
 
-    for doc in documents:
-        total_pages = await session.scalar(
-            select(func.count()).select_from(DocumentPage).where(DocumentPage.document_id == doc.document_id)
-        ) or 0
-
-        ocr_pages = await session.scalar(
-            select(func.count())
-            .select_from(OcrRawText)
-            .join(DocumentPage, OcrRawText.page_id == DocumentPage.page_id)
-            .where(DocumentPage.document_id == doc.document_id)
-        ) or 0
-        spell_pages = await session.scalar(
-            select(func.count())
-            .select_from(OcrSpellcheckedText)
-            .join(DocumentPage, OcrSpellcheckedText.page_id == DocumentPage.page_id)
-            .where(DocumentPage.document_id == doc.document_id)
-        ) or 0
-        deid_pages = await session.scalar(
-            select(func.count())
-            .select_from(OcrDeidentifiedText)
-            .join(DocumentPage, OcrDeidentifiedText.page_id == DocumentPage.page_id)
-            .where(DocumentPage.document_id == doc.document_id)
-        ) or 0
-
-        ocr_status = _stage_status(total_pages, ocr_pages)
-        spell_status = _stage_status(total_pages, spell_pages)
-        deid_status = _stage_status(total_pages, deid_pages)
+    for row in rows:
+        ocr_status = _stage_status(row.total_pages, row.ocr_pages)
+        spell_status = _stage_status(row.total_pages, row.spell_pages)
+        deid_status = _stage_status(row.total_pages, row.deid_pages)
 
         completed_slots += sum(status == "completed" for status in (ocr_status, spell_status, deid_status))
 
         files.append(
             FileStageStatus(
-                file=Path(doc.original_file_path).name if doc.original_file_path else doc.document_id,
+                file=Path(row.original_file_path).name if row.original_file_path else row.document_id,
                 ocr=ocr_status,
                 spellcheck=spell_status,
                 deid=deid_status,
@@ -1,8 +1,12 @@
 """Summary generation and management API routes."""
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.discharge_summary import DischargeSummary
@@ -12,6 +16,7 @@ from app.db.models.template import Template
 from app.db.models.ocr_deidentified_text import OcrDeidentifiedText
 from app.db.models.document_page import DocumentPage
 from app.db.models.document import Document
+from app.db.models.upload_session import UploadSession
 from app.db.session import get_db_session
 from app.schemas.summary_schema import (
     GenerateSummaryRequest,
@@ -24,6 +29,11 @@ from app.utils.logger import get_logger
 router = APIRouter(prefix="/summaries", tags=["summaries"])
 logger = get_logger(__name__)
 
+# Completions run in their own small pool so long LLM calls cannot exhaust the
+# default executor that MinIO and other blocking I/O rely on
+_LLM_MAX_CONCURRENCY = 4
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=_LLM_MAX_CONCURRENCY, thread_name_prefix="summary-llm")
+
 
 @router.post("/generate", response_model=SummaryResponse)
 async def generate_summary(
@@ -41,25 +51,27 @@ async def generate_summary(
     5. Save to discharge_summaries table
     6. Return summary response
     """
-    # 1. Fetch job and validate
-    job = await session.get(Job, request.job_id)
-    if not job:
+    # 1. Fetch job and validate. Its upload session, patient and the requested
+    # template come back in the same round trip; an AsyncSession cannot run
+    # queries concurrently, so the lookups are joined rather than gathered
+    row = (await session.execute(
+        select(Job, UploadSession, Patient, Template)
+        .select_from(Job)
+        .outerjoin(UploadSession, UploadSession.upload_session_id == Job.upload_session_id)
+        .outerjoin(Patient, Patient.patient_id == UploadSession.patient_id)
+        .outerjoin(Template, Template.template_id == request.template_id)
+        .where(Job.job_id == request.job_id)
+    )).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    job, upload_session, patient, template = row
     
     if job.status != "completed":
         raise HTTPException(status_code=400, detail="Job must be completed before generating summary")
     
     # NEW: Check OCR checkpoint is completed
+    # Loaded as a dict by the column type, legacy string rows included
     checkpoints = job.checkpoints
-    if isinstance(checkpoints, str):
-        import json
-        try:
-            checkpoints = json.loads(checkpoints)
-        except:
-            checkpoints = {}
-    elif checkpoints is None:
-        checkpoints = {}
-        
     if checkpoints.get("ocrCheckpoint") != "completed":
         raise HTTPException(
             status_code=400,
@@ -70,41 +82,41 @@ async def generate_summary(
             }
         )
     
-    # 2. Fetch patient info through upload session
-    from app.db.models.upload_session import UploadSession
-    upload_session = await session.get(UploadSession, job.upload_session_id)
+    # 2. Patient info through upload session
     if not upload_session:
         raise HTTPException(status_code=404, detail="Upload session not found for this job")
         
-    patient = await session.get(Patient, upload_session.patient_id)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
     
-    # 3. Fetch template
-    template = await session.get(Template, request.template_id)
+    # 3. Template
     if not template or not template.is_active:
         raise HTTPException(status_code=404, detail="Template not found or inactive")
     
-    # 4. Fetch all validated OCR text for this job
-    documents = (await session.scalars(select(Document).where(Document.job_id == request.job_id))).all()
+    # 4. Fetch all validated OCR text for this job as (page number, text) rows in
+    # one query; the corrected text wins once a page has been validated
+    page_text = case(
+        (
+            and_(
+                OcrDeidentifiedText.is_validated.is_(True),
+                func.nullif(OcrDeidentifiedText.corrected_deid, "").is_not(None),
+            ),
+            OcrDeidentifiedText.corrected_deid,
+        ),
+        else_=OcrDeidentifiedText.deid_text,
+    ).label("text")
+    # Streamed from a server-side cursor so each page's text is held only once, as
+    # its formatted part
+    rows = await session.stream(
+        select(DocumentPage.page_number, page_text)
+        .join(Document, Document.document_id == DocumentPage.document_id)
+        .join(OcrDeidentifiedText, OcrDeidentifiedText.page_id == DocumentPage.page_id)
+        .where(Document.job_id == request.job_id)
+        .order_by(Document.document_id, DocumentPage.page_number)
+        .execution_options(yield_per=256)
+    )
     
-    all_text_parts = []
-    for doc in documents:
-        pages = (await session.scalars(
-            select(DocumentPage)
-            .where(DocumentPage.document_id == doc.document_id)
-            .order_by(DocumentPage.page_number)
-        )).all()
-        
-        for page in pages:
-            deid = await session.scalar(
-                select(OcrDeidentifiedText).where(OcrDeidentifiedText.page_id == page.page_id)
-            )
-            if deid:
-                # Use corrected text if validated, otherwise use original deid text
-                text = deid.corrected_deid if deid.is_validated and deid.corrected_deid else deid.deid_text
-                if text:
-                    all_text_parts.append(f"--- Page {page.page_number} ---\n{text}")
+    all_text_parts = [f"--- Page {page_number} ---\n{text}" async for page_number, text in rows if text]
     
     if not all_text_parts:
         raise HTTPException(status_code=400, detail="No validated text found for this job")
@@ -131,32 +143,44 @@ async def generate_summary(
         "discharge_date": job.updated_at.strftime("%Y-%m-%d") if job.updated_at else "N/A"
     }
     
-    # 7. Generate summary using LLM
+    # End the read transaction so the pooled connection is not held idle in
+    # transaction for the whole completion (loaded rows stay usable: the session
+    # does not expire on commit)
+    await session.commit()
+    
+    # 7. Generate summary using LLM; the OpenAI client call blocks for the whole
+    # completion, so it runs on the LLM executor to keep the event loop serving
     try:
         summary_service = SummaryGenerationService()
-        summary_content = summary_service.generate_summary(
-            validated_text=validated_text,
-            template=template_data,
-            patient_info=patient_info,
-            custom_instructions=request.custom_instructions
+        summary_content = await asyncio.get_running_loop().run_in_executor(
+            _LLM_EXECUTOR,
+            partial(
+                summary_service.generate_summary,
+                validated_text=validated_text,
+                template=template_data,
+                patient_info=patient_info,
+                custom_instructions=request.custom_instructions,
+            ),
         )
     except Exception as e:
         logger.error(f"Failed to generate summary: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate summary: {str(e)}")
     
-    # 8. Save summary to database
-    discharge_summary = DischargeSummary(
-        job_id=request.job_id,
-        patient_id=patient.patient_id,
-        user_id=None,  # TODO: Get from auth context
-        template_id=request.template_id,
-        content=summary_content,
-        status="draft"
+    # 8. Save summary to database; RETURNING hands back the generated id and
+    # timestamps without a refresh SELECT after the commit
+    discharge_summary = await session.scalar(
+        insert(DischargeSummary)
+        .values(
+            job_id=request.job_id,
+            patient_id=patient.patient_id,
+            user_id=None,  # TODO: Get from auth context
+            template_id=request.template_id,
+            content=summary_content,
+            status="draft"
+        )
+        .returning(DischargeSummary)
     )
-    
-    session.add(discharge_summary)
     await session.commit()
-    await session.refresh(discharge_summary)
     
     logger.info(f"Summary generated successfully: {discharge_summary.summary_id}")
     
@@ -1,46 +1,132 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import time
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import get_settings
 from app.db.models.template import Template
 from app.db.session import get_db_session
 from app.schemas.template_schema import TemplateResponse, TemplateListResponse
+from app.utils.etag import etag_matches
 from app.utils.logger import get_logger
+from app.utils.redis_client import get_redis_client
 
 router = APIRouter(prefix="/templates", tags=["templates"])
 logger = get_logger(__name__)
+settings = get_settings()
+redis_client = get_redis_client()
+
+# Redis key holding the active template list shared across workers
+_SHARED_CACHE_KEY = "templates:active"
+
+# Built once so each load reuses the compiled statement
+_ACTIVE_TEMPLATES = (
+    select(Template).where(Template.is_active == True).order_by(Template.category, Template.name)
+)
+
+# Templates change rarely; browsers and proxies may reuse them for a few minutes
+# and serve a stale copy while revalidating
+_TEMPLATE_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=3600"
+
+# Active template list held by this worker, with the monotonic time it was loaded
+# and its ETag
+_template_cache: tuple[float, TemplateListResponse, str] | None = None
+
+
+async def _get_shared_templates() -> TemplateListResponse | None:
+    """Look up the template list cached by any worker; cache failures count as a miss."""
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(_SHARED_CACHE_KEY)
+    except Exception as e:
+        logger.warning("template.shared_cache_error", error=str(e))
+        return None
+    return TemplateListResponse.model_validate_json(cached) if cached is not None else None
+
+
+async def _put_shared_templates(response: TemplateListResponse) -> None:
+    """Publish the template list to the shared cache for the configured TTL."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(
+            _SHARED_CACHE_KEY,
+            response.model_dump_json(),
+            ex=settings.template_cache_ttl_seconds,
+        )
+    except Exception as e:
+        logger.warning("template.shared_cache_error", error=str(e))
+
+
+def _templates_etag(templates: TemplateListResponse) -> str:
+    """Weak ETag over the serialized template list."""
+    digest = hashlib.blake2b(templates.model_dump_json().encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+async def _load_templates(session: AsyncSession) -> tuple[TemplateListResponse, str]:
+    """
+    Active templates with their ETag. Templates rarely change, so the list is
+    cached per worker (and in Redis when configured) for `template_cache_ttl_seconds`.
+    """
+    global _template_cache
+    if _template_cache is not None:
+        loaded_at, cached, etag = _template_cache
+        if time.monotonic() - loaded_at < settings.template_cache_ttl_seconds:
+            return cached, etag
+
+    templates = await _get_shared_templates()
+    if templates is None:
+        result = await session.scalars(_ACTIVE_TEMPLATES)
+        templates = TemplateListResponse(
+            templates=[
+                TemplateResponse(
+                    id=t.template_id,
+                    name=t.name,
+                    description=t.description,
+                    type=t.template_type,
+                    category=t.category,
+                    sections=t.sections,
+                    estimatedTime=t.estimated_time
+                )
+                for t in result.all()
+            ]
+        )
+        await _put_shared_templates(templates)
+
+    etag = _templates_etag(templates)
+    _template_cache = (time.monotonic(), templates, etag)
+    return templates, etag
 
 
 @router.get("", response_model=TemplateListResponse)
-async def get_templates(session: AsyncSession = Depends(get_db_session)) -> TemplateListResponse:
+async def get_templates(
+    response: Response,
+    session: AsyncSession = Depends(get_db_session),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+) -> TemplateListResponse | Response:
     """
     Retrieve all active discharge summary templates.
     """
-    result = await session.scalars(
-        select(Template).where(Template.is_active == True).order_by(Template.category, Template.name)
-    )
-    templates = result.all()
-    
-    template_responses = [
-        TemplateResponse(
-            id=t.template_id,
-            name=t.name,
-            description=t.description,
-            type=t.template_type,
-            category=t.category,
-            sections=t.sections,
-            estimatedTime=t.estimated_time
-        )
-        for t in templates
-    ]
-    
-    return TemplateListResponse(templates=template_responses)
+    templates, etag = await _load_templates(session)
+    headers = {"Cache-Control": _TEMPLATE_CACHE_CONTROL, "ETag": etag}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return templates
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-async def get_template(template_id: str, session: AsyncSession = Depends(get_db_session)) -> TemplateResponse:
+async def get_template(
+    template_id: str,
+    response: Response,
+    session: AsyncSession = Depends(get_db_session),
+) -> TemplateResponse:
     """
     Retrieve a specific template by ID.
     """
@@ -51,6 +137,7 @@ async def get_template(template_id: str, session: AsyncSession = Depends(get_db_
     if not template.is_active:
         raise HTTPException(status_code=404, detail="Template is inactive")
     
+    response.headers["Cache-Control"] = _TEMPLATE_CACHE_CONTROL
     return TemplateResponse(
         id=template.template_id,
         name=template.name,
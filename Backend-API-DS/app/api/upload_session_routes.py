@@ -87,11 +87,11 @@ async def list_upload_sessions(
                 patient_name=s.patient.full_name if s.patient else None,
                 patient_mrn=s.patient.medical_record_number if s.patient else None,
                 status=s.status,
-                document_count=len(s.documents) if s.documents else 0,
+                document_count=document_count,
                 created_at=s.created_at,
                 updated_at=s.updated_at,
             )
-            for s in sessions_list
+            for s, document_count in sessions_list
         ],
         total=total,
     )
@@ -175,27 +175,24 @@ async def upload_files(
         )
 
     doc_type_value = doc_type.value if doc_type else "unknown"
-    uploaded_files = []
-
-    for file in files:
-        document = await service.upload_file(
-            session=session,
-            upload_session=upload_session,
-            user=current_user,
-            file=file,
-            doc_type=doc_type_value,
-        )
+    documents = await service.upload_files(
+        session=session,
+        upload_session=upload_session,
+        user=current_user,
+        files=files,
+        doc_type=doc_type_value,
+    )
 
-        if document:
-            uploaded_files.append(
-                FileUploadResponse(
-                    document_id=document.document_id,
-                    original_filename=document.original_filename or "",
-                    doc_type=document.doc_type,
-                    file_size=document.file_size or 0,
-                    status=document.status,
-                )
-            )
+    uploaded_files = [
+        FileUploadResponse(
+            document_id=document.document_id,
+            original_filename=document.original_filename or "",
+            doc_type=document.doc_type,
+            file_size=document.file_size or 0,
+            status=document.status,
+        )
+        for document in documents
+    ]
 
     return FilesUploadResponse(
         upload_session_id=upload_session_id,
@@ -1,10 +1,48 @@
-from sqlalchemy.orm import DeclarativeBase, declared_attr
-from sqlalchemy import MetaData
+from datetime import datetime
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+from sqlalchemy import DateTime, MetaData, func, text
+from sqlalchemy.dialects.postgresql import UUID
+
+# Primary keys are generated by PostgreSQL (gen_random_uuid is built in since 13)
+# and returned by the INSERT, rather than formatted in Python for every row
+UUID_SERVER_DEFAULT = text("gen_random_uuid()::text")
+
+# Ids that are never accepted from clients are stored as native uuid (16 bytes
+# instead of 36 characters, in the table and its index); they are still str in
+# Python. Client-facing ids stay strings so a malformed id is simply not found
+NATIVE_UUID = UUID(as_uuid=False)
+NATIVE_UUID_SERVER_DEFAULT = text("gen_random_uuid()")
 
 
 class Base(DeclarativeBase):
+    # Relationships are declared lazy="raise_on_sql": an AsyncSession cannot emit
+    # SQL on attribute access, so queries load what they need with selectinload()
+    # (or select the columns directly) and a missed load fails loudly instead of
+    # turning into MissingGreenlet or a per-row query. Identity-map hits and
+    # unit-of-work cascades still work.
+    #
+    # Timestamps are set by PostgreSQL; fetch them with RETURNING on INSERT and
+    # UPDATE so they are loaded without a lazy refresh (not possible under asyncio)
+    __mapper_args__ = {"eager_defaults": True}
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
 
+
+class CreatedAtMixin:
+    """Row creation time, set by PostgreSQL."""
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class TimestampMixin:
+    """Creation and last ORM update times, set by PostgreSQL."""
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -1,27 +1,26 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, CreatedAtMixin, NATIVE_UUID, NATIVE_UUID_SERVER_DEFAULT
 
 
 if TYPE_CHECKING:
     from app.db.models.user import User
 
 
-class AuthSession(Base):
+class AuthSession(CreatedAtMixin, Base):
     """Authentication session table for JWT tokens."""
     __tablename__ = "auth_sessions"
 
     session_id: Mapped[str] = mapped_column(
-        String(36),
+        NATIVE_UUID,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=NATIVE_UUID_SERVER_DEFAULT,
     )
     user_id: Mapped[str] = mapped_column(
         ForeignKey("users.user_id", ondelete="CASCADE"),
@@ -31,7 +30,11 @@ class AuthSession(Base):
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+    # Logout-everywhere deletes by user; expiry sweeps range over expires_at
+    __table_args__ = (
+        Index('ix_auth_sessions_user_id_expires_at', 'user_id', 'expires_at'),
+    )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="auth_sessions")
+    user: Mapped["User"] = relationship("User", back_populates="auth_sessions", lazy="raise_on_sql")
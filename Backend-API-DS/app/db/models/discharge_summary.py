@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import enum
-import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 class DischargeSummaryStatusEnum(str, enum.Enum):
@@ -24,14 +23,14 @@ if TYPE_CHECKING:
     from app.db.models.user import User
 
 
-class DischargeSummary(Base):
+class DischargeSummary(TimestampMixin, Base):
     """Discharge summary table - final output of the pipeline."""
     __tablename__ = "discharge_summaries"
 
     summary_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     job_id: Mapped[str] = mapped_column(
         ForeignKey("jobs.job_id", ondelete="CASCADE"),
@@ -55,14 +54,13 @@ class DischargeSummary(Base):
     finalized_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     signed_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
     signed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+
+    # Summaries are fetched by job
+    __table_args__ = (
+        Index('ix_discharge_summaries_job_id', 'job_id'),
     )
 
     # Relationships
-    job: Mapped["Job"] = relationship("Job", back_populates="discharge_summary")
-    patient: Mapped["Patient"] = relationship("Patient", back_populates="discharge_summaries")
-    user: Mapped["User"] = relationship("User", back_populates="discharge_summaries")
+    job: Mapped["Job"] = relationship("Job", back_populates="discharge_summary", lazy="raise_on_sql")
+    patient: Mapped["Patient"] = relationship("Patient", back_populates="discharge_summaries", lazy="raise_on_sql")
+    user: Mapped["User"] = relationship("User", back_populates="discharge_summaries", lazy="raise_on_sql")
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import enum
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 class DocumentStatusEnum(str, enum.Enum):
@@ -25,19 +23,20 @@ if TYPE_CHECKING:
     from app.db.models.document_page import DocumentPage
 
 
-class Document(Base):
+class Document(TimestampMixin, Base):
     """Document table - stores uploaded document metadata."""
     __tablename__ = "documents"
 
     document_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     # Job ID is now nullable - set when upload session is committed
     job_id: Mapped[str | None] = mapped_column(
         ForeignKey("jobs.job_id", ondelete="CASCADE"),
         nullable=True,
+        index=True,
     )
     # Link to upload session (nullable for legacy flow)
     upload_session_id: Mapped[str | None] = mapped_column(
@@ -57,18 +56,23 @@ class Document(Base):
         String(20),
         default=DocumentStatusEnum.UPLOADED.value,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+
+    # Patient document lists filter on status; uploads are listed per session
+    __table_args__ = (
+        Index('ix_documents_patient_id_status', 'patient_id', 'status'),
+        Index('ix_documents_upload_session_id', 'upload_session_id'),
     )
 
     # Relationships
-    job: Mapped["Job"] = relationship("Job", back_populates="documents")
+    job: Mapped["Job"] = relationship("Job", back_populates="documents", lazy="raise_on_sql")
     upload_session: Mapped["UploadSession"] = relationship(
-        "UploadSession", back_populates="documents"
+        "UploadSession", back_populates="documents",
+        lazy="raise_on_sql",
     )
     pages: Mapped[List["DocumentPage"]] = relationship(
-        "DocumentPage", back_populates="document", cascade="all, delete-orphan"
+        "DocumentPage",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        order_by="DocumentPage.page_number",
+        lazy="raise_on_sql",
     )
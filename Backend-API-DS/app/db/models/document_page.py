@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, String
+from sqlalchemy import ForeignKey, Index, Integer, Text, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 if TYPE_CHECKING:
@@ -17,30 +15,31 @@ if TYPE_CHECKING:
     from app.db.models.ocr_deidentified_text import OcrDeidentifiedText
 
 
-class DocumentPage(Base):
+class DocumentPage(TimestampMixin, Base):
     __tablename__ = "document_pages"
 
     page_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     document_id: Mapped[str] = mapped_column(ForeignKey("documents.document_id", ondelete="CASCADE"), nullable=False)
     page_number: Mapped[int] = mapped_column(Integer, nullable=False)
     image_minio_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+
+    # Pages are looked up by document and read in page order
+    __table_args__ = (
+        Index('ix_document_pages_document_id_page_number', 'document_id', 'page_number'),
     )
 
-    document: Mapped["Document"] = relationship("Document", back_populates="pages")
-    raw_text: Mapped["OcrRawText"] = relationship("OcrRawText", back_populates="page", uselist=False)
+    document: Mapped["Document"] = relationship("Document", back_populates="pages", lazy="raise_on_sql")
+    raw_text: Mapped["OcrRawText"] = relationship("OcrRawText", back_populates="page", uselist=False, lazy="raise_on_sql")
     spellchecked_text: Mapped["OcrSpellcheckedText"] = relationship(
-        "OcrSpellcheckedText", back_populates="page", uselist=False
+        "OcrSpellcheckedText", back_populates="page", uselist=False,
+        lazy="raise_on_sql",
     )
     deidentified_text: Mapped["OcrDeidentifiedText"] = relationship(
-        "OcrDeidentifiedText", back_populates="page", uselist=False
+        "OcrDeidentifiedText", back_populates="page", uselist=False,
+        lazy="raise_on_sql",
     )
 
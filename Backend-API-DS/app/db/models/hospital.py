@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 if TYPE_CHECKING:
@@ -15,26 +13,20 @@ if TYPE_CHECKING:
     from app.db.models.patient import Patient
 
 
-class Hospital(Base):
+class Hospital(TimestampMixin, Base):
     """Hospital master data table."""
     __tablename__ = "hospitals"
 
     hospital_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     address: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
-    )
 
     # Relationships
-    users: Mapped[List["User"]] = relationship("User", back_populates="hospital")
-    patients: Mapped[List["Patient"]] = relationship("Patient", back_populates="hospital")
+    users: Mapped[List["User"]] = relationship("User", back_populates="hospital", lazy="raise_on_sql")
+    patients: Mapped[List["Patient"]] = relationship("Patient", back_populates="hospital", lazy="raise_on_sql")
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import enum
-import uuid
-from datetime import datetime
+import json
 
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import ForeignKey, String, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 class JobStatusEnum(str, enum.Enum):
@@ -27,14 +28,29 @@ if TYPE_CHECKING:
     from app.db.models.discharge_summary import DischargeSummary
 
 
-class Job(Base):
+class CheckpointsType(TypeDecorator):
+    """JSONB checkpoints that always load as a dict, decoding legacy rows stored as a JSON string."""
+
+    impl = JSONB
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return {}
+        return value if isinstance(value, dict) else {}
+
+
+class Job(TimestampMixin, Base):
     """Job table - created when user commits upload session."""
     __tablename__ = "jobs"
 
     job_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     # New: Link to user who created the job
     user_id: Mapped[str | None] = mapped_column(
@@ -52,30 +68,28 @@ class Job(Base):
         default=JobStatusEnum.PENDING.value,
         nullable=False,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
-    )
-    checkpoints: Mapped[dict | None] = mapped_column(
-        JSONB,
-        nullable=True,
-        default=lambda: {
-            "ocrCheckpoint": "pending",
-            "dischargeMedicationsCheckpoint": "pending",
-            "dischargeSummaryCheckpoint": "pending"
-        }
+    # Filled in by PostgreSQL and returned by the INSERT, so no dict is built
+    # and serialized per job
+    checkpoints: Mapped[dict] = mapped_column(
+        MutableDict.as_mutable(CheckpointsType),
+        nullable=False,
+        server_default=text(
+            """'{"ocrCheckpoint": "pending", "dischargeMedicationsCheckpoint": "pending", """
+            """"dischargeSummaryCheckpoint": "pending"}'::jsonb"""
+        ),
     )
 
     # Relationships
     documents: Mapped[List["Document"]] = relationship(
-        "Document", back_populates="job", cascade="all, delete-orphan"
+        "Document", back_populates="job", cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
-    user: Mapped["User"] = relationship("User", back_populates="jobs")
+    user: Mapped["User"] = relationship("User", back_populates="jobs", lazy="raise_on_sql")
     upload_session: Mapped["UploadSession"] = relationship(
-        "UploadSession", back_populates="job"
+        "UploadSession", back_populates="job",
+        lazy="raise_on_sql",
     )
     discharge_summary: Mapped["DischargeSummary"] = relationship(
-        "DischargeSummary", back_populates="job", uselist=False
+        "DischargeSummary", back_populates="job", uselist=False,
+        lazy="raise_on_sql",
     )
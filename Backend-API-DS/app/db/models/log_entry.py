@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, CreatedAtMixin, NATIVE_UUID, NATIVE_UUID_SERVER_DEFAULT
 
 
 if TYPE_CHECKING:
@@ -15,16 +13,21 @@ if TYPE_CHECKING:
     from app.db.models.document import Document
 
 
-class LogEntry(Base):
+class LogEntry(CreatedAtMixin, Base):
     __tablename__ = "logs"
 
-    log_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    log_id: Mapped[str] = mapped_column(NATIVE_UUID, primary_key=True, server_default=NATIVE_UUID_SERVER_DEFAULT)
     job_id: Mapped[str | None] = mapped_column(ForeignKey("jobs.job_id", ondelete="CASCADE"), nullable=True)
     document_id: Mapped[str | None] = mapped_column(ForeignKey("documents.document_id", ondelete="CASCADE"), nullable=True)
     level: Mapped[str] = mapped_column(String(20), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
-    job: Mapped["Job"] = relationship("Job", backref="logs")
-    document: Mapped["Document"] = relationship("Document", backref="logs")
+    # Logs are tailed per job; document_id also backs the ON DELETE CASCADE
+    __table_args__ = (
+        Index('ix_logs_job_id_created_at', 'job_id', 'created_at'),
+        Index('ix_logs_document_id', 'document_id'),
+    )
+
+    job: Mapped["Job"] = relationship("Job", backref=backref("logs", lazy="raise_on_sql"), lazy="raise_on_sql")
+    document: Mapped["Document"] = relationship("Document", backref=backref("logs", lazy="raise_on_sql"), lazy="raise_on_sql")
 
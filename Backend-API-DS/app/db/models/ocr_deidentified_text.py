@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, JSON, Boolean
+from sqlalchemy import ForeignKey, Text, JSON, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, CreatedAtMixin, NATIVE_UUID, NATIVE_UUID_SERVER_DEFAULT
 
 
-class OcrDeidentifiedText(Base):
+class OcrDeidentifiedText(CreatedAtMixin, Base):
     __tablename__ = "ocr_deidentified_texts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(NATIVE_UUID, primary_key=True, server_default=NATIVE_UUID_SERVER_DEFAULT)
     page_id: Mapped[str] = mapped_column(
         ForeignKey("document_pages.page_id", ondelete="CASCADE"),
         unique=True,
@@ -24,7 +22,6 @@ class OcrDeidentifiedText(Base):
     result_metadata: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
     entities_found: Mapped[list | None] = mapped_column(JSON, nullable=True)
     entities_count: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
-    page: Mapped["DocumentPage"] = relationship("DocumentPage", back_populates="deidentified_text")
+    page: Mapped["DocumentPage"] = relationship("DocumentPage", back_populates="deidentified_text", lazy="raise_on_sql")
 
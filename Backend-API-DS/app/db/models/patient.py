@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime, date
+from datetime import date
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Date, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Date, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 if TYPE_CHECKING:
@@ -16,14 +15,14 @@ if TYPE_CHECKING:
     from app.db.models.discharge_summary import DischargeSummary
 
 
-class Patient(Base):
+class Patient(TimestampMixin, Base):
     """Patient table for storing patient information."""
     __tablename__ = "patients"
 
     patient_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     hospital_id: Mapped[str] = mapped_column(
         ForeignKey("hospitals.hospital_id", ondelete="CASCADE"),
@@ -36,12 +35,6 @@ class Patient(Base):
     contact_number: Mapped[str | None] = mapped_column(String(20), nullable=True)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     address: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
-    )
 
     # Unique constraint: one MRN per hospital
     __table_args__ = (
@@ -49,10 +42,12 @@ class Patient(Base):
     )
 
     # Relationships
-    hospital: Mapped["Hospital"] = relationship("Hospital", back_populates="patients")
+    hospital: Mapped["Hospital"] = relationship("Hospital", back_populates="patients", lazy="raise_on_sql")
     upload_sessions: Mapped[List["UploadSession"]] = relationship(
-        "UploadSession", back_populates="patient"
+        "UploadSession", back_populates="patient",
+        lazy="raise_on_sql",
     )
     discharge_summaries: Mapped[List["DischargeSummary"]] = relationship(
-        "DischargeSummary", back_populates="patient"
+        "DischargeSummary", back_populates="patient",
+        lazy="raise_on_sql",
     )
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime
 from typing import List
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, func
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
-from app.db.base import Base
+from app.db.base import Base, UUID_SERVER_DEFAULT
 
 
 class Template(Base):
     __tablename__ = "templates"
 
-    template_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    template_id = Column(String, primary_key=True, server_default=UUID_SERVER_DEFAULT)
     name = Column(String, nullable=False)
     description = Column(String, nullable=False)
     template_type = Column(String, nullable=False)  # 'standard', 'detailed', 'brief'
@@ -20,5 +18,11 @@ class Template(Base):
     sections = Column(JSON, nullable=False)  # Array of section descriptions
     estimated_time = Column(Integer, nullable=False)  # Minutes
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Naive UTC timestamps, as these columns have no time zone
+    created_at = Column(DateTime, server_default=func.timezone("utc", func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
+        nullable=False,
+    )
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import enum
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 class UploadSessionStatusEnum(str, enum.Enum):
@@ -24,14 +22,14 @@ if TYPE_CHECKING:
     from app.db.models.job import Job
 
 
-class UploadSession(Base):
+class UploadSession(TimestampMixin, Base):
     """Upload session table - staging area for document uploads before commit."""
     __tablename__ = "upload_sessions"
 
     upload_session_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     user_id: Mapped[str] = mapped_column(
         ForeignKey("users.user_id", ondelete="CASCADE"),
@@ -46,17 +44,17 @@ class UploadSession(Base):
         default=UploadSessionStatusEnum.ACTIVE.value,
         nullable=False,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+
+    # Active sessions are listed per user
+    __table_args__ = (
+        Index('ix_upload_sessions_user_id_status', 'user_id', 'status'),
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="upload_sessions")
-    patient: Mapped["Patient"] = relationship("Patient", back_populates="upload_sessions")
+    user: Mapped["User"] = relationship("User", back_populates="upload_sessions", lazy="raise_on_sql")
+    patient: Mapped["Patient"] = relationship("Patient", back_populates="upload_sessions", lazy="raise_on_sql")
     documents: Mapped[List["Document"]] = relationship(
-        "Document", back_populates="upload_session", cascade="all, delete-orphan"
+        "Document", back_populates="upload_session", cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
-    job: Mapped["Job"] = relationship("Job", back_populates="upload_session", uselist=False)
+    job: Mapped["Job"] = relationship("Job", back_populates="upload_session", uselist=False, lazy="raise_on_sql")
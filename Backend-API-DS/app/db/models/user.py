@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import enum
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampMixin, UUID_SERVER_DEFAULT
 
 
 class UserRoleEnum(str, enum.Enum):
@@ -26,14 +24,14 @@ if TYPE_CHECKING:
     from app.db.models.discharge_summary import DischargeSummary
 
 
-class User(Base):
+class User(TimestampMixin, Base):
     """User table for doctors, nurses, and staff."""
     __tablename__ = "users"
 
     user_id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        server_default=UUID_SERVER_DEFAULT,
     )
     hospital_id: Mapped[str] = mapped_column(
         ForeignKey("hospitals.hospital_id", ondelete="CASCADE"),
@@ -49,22 +47,19 @@ class User(Base):
     )
     department: Mapped[str | None] = mapped_column(String(100), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
-    )
 
     # Relationships
-    hospital: Mapped["Hospital"] = relationship("Hospital", back_populates="users")
+    hospital: Mapped["Hospital"] = relationship("Hospital", back_populates="users", lazy="raise_on_sql")
     auth_sessions: Mapped[List["AuthSession"]] = relationship(
-        "AuthSession", back_populates="user", cascade="all, delete-orphan"
+        "AuthSession", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     upload_sessions: Mapped[List["UploadSession"]] = relationship(
-        "UploadSession", back_populates="user", cascade="all, delete-orphan"
+        "UploadSession", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
-    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="user")
+    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="user", lazy="raise_on_sql")
     discharge_summaries: Mapped[List["DischargeSummary"]] = relationship(
-        "DischargeSummary", back_populates="user"
+        "DischargeSummary", back_populates="user",
+        lazy="raise_on_sql",
     )
@@ -8,6 +8,18 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.app_env == "development",
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    connect_args={
+        # asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        # The short OLTP queries here never benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+        "command_timeout": settings.db_command_timeout_seconds,
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
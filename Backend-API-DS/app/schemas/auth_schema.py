@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class LoginRequest(BaseModel):
@@ -35,6 +35,8 @@ class RegisterRequest(BaseModel):
 
 class UserResponse(BaseModel):
     """User response schema."""
+    model_config = ConfigDict(from_attributes=True)
+
     user_id: str
     email: str
     full_name: str
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PatientCreate(BaseModel):
@@ -29,6 +29,8 @@ class PatientUpdate(BaseModel):
 
 class PatientResponse(BaseModel):
     """Schema for patient response."""
+    model_config = ConfigDict(from_attributes=True)
+
     patient_id: str
     hospital_id: str
     medical_record_number: str
@@ -189,16 +189,7 @@ class AuthService:
         if not user:
             return None
 
-        return UserResponse(
-            user_id=user.user_id,
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role,
-            department=user.department,
-            hospital_id=user.hospital_id,
-            is_active=user.is_active,
-            created_at=user.created_at,
-        )
+        return UserResponse.model_validate(user)
 
     async def register_user(
         self,
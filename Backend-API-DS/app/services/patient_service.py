@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import select, or_
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.patient import Patient
@@ -20,35 +21,31 @@ class PatientService:
         session: AsyncSession,
         hospital_id: str,
         data: PatientCreate,
-    ) -> Optional[Patient]:
-        """Create a new patient."""
-        # Check if MRN already exists for this hospital
-        existing = await session.scalar(
-            select(Patient).where(
-                Patient.hospital_id == hospital_id,
-                Patient.medical_record_number == data.medical_record_number,
+    ) -> Patient:
+        """Create a patient, or return the existing one for this MRN.
+
+        ``INSERT ... ON CONFLICT DO NOTHING ... RETURNING`` against
+        ``uq_hospital_mrn`` creates the patient in one round trip; only when
+        the MRN already exists is the stored record selected, unchanged.
+        """
+        stmt = (
+            pg_insert(Patient)
+            .values(**data.model_dump(), hospital_id=hospital_id)
+            .on_conflict_do_nothing(
+                index_elements=[Patient.hospital_id, Patient.medical_record_number],
             )
+            .returning(Patient)
         )
-        if existing:
-            logger.warning(
-                "patient.create_failed",
-                reason="mrn_exists",
-                mrn=data.medical_record_number,
-                hospital_id=hospital_id,
+        patient = await session.scalar(stmt)
+        if patient is None:
+            patient = await session.scalar(
+                select(Patient).where(
+                    Patient.hospital_id == hospital_id,
+                    Patient.medical_record_number == data.medical_record_number,
+                )
             )
-            return None
-
-        patient = Patient(
-            hospital_id=hospital_id,
-            medical_record_number=data.medical_record_number,
-            full_name=data.full_name,
-            date_of_birth=data.date_of_birth,
-            gender=data.gender,
-            contact_number=data.contact_number,
-            email=data.email,
-            address=data.address,
-        )
-        session.add(patient)
+            logger.info("patient.exists", patient_id=patient.patient_id, mrn=data.medical_record_number)
+            return patient
         await session.commit()
 
         logger.info("patient.created", patient_id=patient.patient_id, mrn=data.medical_record_number)
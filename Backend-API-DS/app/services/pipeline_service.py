@@ -4,6 +4,7 @@ import asyncio
 import base64
 import json
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -449,8 +450,7 @@ def get_result_path_for_document(
     return f"{hospital_id}/{patient_id}/results/{job_id}/{document_id}/{result_type}"
 
 
-_pipeline_service = PipelineService()
-
-
+@lru_cache
 def get_pipeline_service() -> PipelineService:
-    return _pipeline_service
+    """Process-wide pipeline, built on first use rather than at import."""
+    return PipelineService()
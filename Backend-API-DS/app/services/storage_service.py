@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Tuple
+from typing import AsyncIterator, BinaryIO, Iterable, Tuple
 
 from app.utils.minio_client import get_minio_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# S3/MinIO multi-object delete accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+
+# Directory listings in flight per bulk delete (each one occupies a worker thread)
+_LIST_CONCURRENCY = 8
+
 
 class StorageService:
     def __init__(self) -> None:
@@ -19,12 +25,28 @@ class StorageService:
         logger.info("storage.upload.completed", path=path)
         return path
 
+    async def store_stream(self, path: str, stream: BinaryIO, length: int, content_type: str) -> str:
+        """Store a file-like object without reading it into memory first."""
+        logger.info("storage.upload.start", path=path, size=length)
+        await self.client.upload_stream(path, stream, length, content_type)
+        logger.info("storage.upload.completed", path=path)
+        return path
+
     async def retrieve_file(self, path: str) -> bytes:
         logger.info("storage.download.start", path=path)
         content = await self.client.download(path)
         logger.info("storage.download.completed", path=path)
         return content
 
+    async def stat_file(self, path: str) -> tuple[int, str | None]:
+        """Size in bytes and ETag of a stored file."""
+        return await self.client.stat(path)
+
+    async def open_stream(self, path: str, offset: int = 0, length: int = 0) -> AsyncIterator[bytes]:
+        """Stream a file, or a byte range of it, from MinIO without buffering it whole."""
+        logger.info("storage.stream.start", path=path, offset=offset, length=length)
+        return await self.client.open_stream(path, offset=offset, length=length)
+
     async def delete_file(self, path: str) -> None:
         """Delete a single file from MinIO storage."""
         logger.info("storage.delete_file.start", path=path)
@@ -37,6 +59,60 @@ class StorageService:
         await self.client.delete_directory(directory_path)
         logger.info("storage.delete_directory.completed", directory_path=directory_path)
 
+    async def delete_files_bulk(
+        self,
+        paths: Iterable[str],
+        directories: Iterable[str] = (),
+    ) -> None:
+        """
+        Delete files and whole directories from MinIO in batched multi-object requests.
+        
+        Raises ConnectionError if any directory could not be listed, after deleting
+        everything that could be, so callers never report those objects as removed.
+        """
+        paths = list(paths)
+        directories = list(directories)
+        logger.info(
+            "storage.delete_files_bulk.start",
+            file_count=len(paths),
+            directory_count=len(directories),
+        )
+        semaphore = asyncio.Semaphore(_LIST_CONCURRENCY)
+        
+        async def list_directory(directory: str) -> list[str]:
+            async with semaphore:
+                return await self.client.list_objects(directory)
+        
+        listings = await asyncio.gather(
+            *(list_directory(d) for d in directories),
+            return_exceptions=True,
+        )
+        object_names = set(paths)
+        failed_directories = []
+        for directory, listing in zip(directories, listings):
+            if isinstance(listing, BaseException):
+                failed_directories.append(directory)
+                logger.warning(
+                    "storage.delete_files_bulk.list_failed",
+                    directory_path=directory,
+                    error=str(listing),
+                )
+            else:
+                object_names.update(listing)
+        object_names = sorted(object_names)
+        await asyncio.gather(
+            *(
+                self.client.delete_files(object_names[i:i + _DELETE_BATCH_SIZE])
+                for i in range(0, len(object_names), _DELETE_BATCH_SIZE)
+            )
+        )
+        logger.info("storage.delete_files_bulk.completed", object_count=len(object_names))
+        if failed_directories:
+            raise ConnectionError(
+                f"Failed to list {len(failed_directories)} MinIO directories, their files "
+                f"were not deleted (first: {failed_directories[0]})"
+            )
+
 
 def get_storage_service() -> StorageService:
     return StorageService()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -79,6 +80,7 @@ class UploadService:
         return job.job_id
 
 
+@lru_cache
 def get_upload_service() -> UploadService:
     return UploadService()
 
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 from fastapi import UploadFile
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.db.models.document import Document, DocumentStatusEnum
 from app.db.models.job import Job, JobStatusEnum
@@ -20,6 +22,15 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Files of one upload request written to MinIO at the same time
+_UPLOAD_CONCURRENCY = 8
+
+
+def _spooled_size(stream: BinaryIO) -> int:
+    """Size of an uploaded file when the request did not report it."""
+    stream.seek(0, os.SEEK_END)
+    return stream.tell()
+
 
 class UploadSessionService:
     """Service for managing upload sessions."""
@@ -75,6 +86,8 @@ class UploadSessionService:
             select(UploadSession)
             .options(selectinload(UploadSession.documents))
             .options(selectinload(UploadSession.patient))
+            # Any other relationship access raises instead of lazy loading
+            .options(raiseload("*"))
             .where(
                 UploadSession.upload_session_id == upload_session_id,
                 UploadSession.user_id == user.user_id,
@@ -87,52 +100,130 @@ class UploadSessionService:
         user: User,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[List[UploadSession], int]:
-        """Get active upload sessions for a user."""
-        query = (
-            select(UploadSession)
-            .options(selectinload(UploadSession.documents))
-            .options(selectinload(UploadSession.patient))
-            .where(
-                UploadSession.user_id == user.user_id,
-                UploadSession.status == UploadSessionStatusEnum.ACTIVE.value,
-            )
-            .order_by(UploadSession.created_at.desc())
+    ) -> tuple[List[tuple[UploadSession, int]], int]:
+        """Get active upload sessions for a user, each with its document count."""
+        filters = (
+            UploadSession.user_id == user.user_id,
+            UploadSession.status == UploadSessionStatusEnum.ACTIVE.value,
         )
 
         # Get total count
-        all_sessions = (await session.scalars(query)).all()
-        total = len(all_sessions)
-
-        # Get paginated results
-        query = query.limit(limit).offset(offset)
-        sessions_list = (await session.scalars(query)).all()
+        total = await session.scalar(
+            select(func.count()).select_from(UploadSession).where(*filters)
+        ) or 0
+
+        # Get paginated results; documents are counted in SQL rather than loaded
+        document_count = (
+            select(func.count(Document.document_id))
+            .where(Document.upload_session_id == UploadSession.upload_session_id)
+            .correlate(UploadSession)
+            .scalar_subquery()
+        )
+        query = (
+            select(UploadSession, document_count)
+            .options(selectinload(UploadSession.patient), raiseload("*"))
+            .where(*filters)
+            .order_by(UploadSession.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await session.execute(query)).all()
 
-        return list(sessions_list), total
+        return [(upload_session, count) for upload_session, count in rows], total
 
-    async def upload_file(
+    async def upload_files(
         self,
         session: AsyncSession,
         upload_session: UploadSession,
         user: User,
-        file: UploadFile,
+        files: List[UploadFile],
         doc_type: str,
-    ) -> Optional[Document]:
-        """Upload a file to an upload session."""
+    ) -> List[Document]:
+        """Upload files to an upload session."""
         if upload_session.status != UploadSessionStatusEnum.ACTIVE.value:
             logger.warning(
                 "upload_session.upload_failed",
                 reason="session_not_active",
                 upload_session_id=upload_session.upload_session_id,
             )
-            return None
+            return []
 
         # Get patient for storage path
         patient = await session.get(Patient, upload_session.patient_id)
         if not patient:
-            return None
+            return []
+
+        # Storage writes overlap; the AsyncSession is not safe for concurrent use,
+        # so the documents are recorded afterwards in one batch
+        semaphore = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+        uploads: list[asyncio.Future[Document]] = []
+
+        async def store(file: UploadFile) -> Document:
+            async with semaphore:
+                # Shielded: a MinIO write running in a worker thread cannot be
+                # stopped, so on failure it is awaited and its object removed
+                upload = asyncio.ensure_future(
+                    self._store_file(upload_session, user, patient, file, doc_type)
+                )
+                uploads.append(upload)
+                return await asyncio.shield(upload)
+
+        try:
+            # A failed upload cancels the files still waiting for a slot
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(store(file)) for file in files]
+        except* Exception as group:
+            await self._discard_uploads(upload_session, uploads)
+            raise group.exceptions[0]
+        documents = [task.result() for task in tasks]
+
+        session.add_all(documents)
+        await session.commit()
 
-        content = await file.read()
+        for document in documents:
+            logger.info(
+                "upload_session.file_uploaded",
+                upload_session_id=upload_session.upload_session_id,
+                document_id=document.document_id,
+                filename=document.original_filename,
+            )
+        return list(documents)
+
+    async def _discard_uploads(
+        self,
+        upload_session: UploadSession,
+        uploads: list[asyncio.Future[Document]],
+    ) -> None:
+        """Wait for started uploads and delete the stored originals; no document row references them."""
+        results = await asyncio.gather(*uploads, return_exceptions=True)
+        stored_paths = [result.original_file_path for result in results if isinstance(result, Document)]
+        logger.warning(
+            "upload_session.upload_failed",
+            reason="storage_error",
+            upload_session_id=upload_session.upload_session_id,
+            discarded_count=len(stored_paths),
+        )
+        if not stored_paths:
+            return
+        try:
+            await self.storage.delete_files_bulk(stored_paths)
+        except Exception as e:
+            logger.error(
+                "upload_session.discard_failed",
+                upload_session_id=upload_session.upload_session_id,
+                paths=stored_paths,
+                error=str(e),
+            )
+
+    async def _store_file(
+        self,
+        upload_session: UploadSession,
+        user: User,
+        patient: Patient,
+        file: UploadFile,
+        doc_type: str,
+    ) -> Document:
+        """Store an uploaded file in MinIO and build its (unsaved) document row."""
         document_id = str(uuid.uuid4())
 
         file_kind = detect_file_kind(file.filename or "", file.content_type or "")
@@ -153,9 +244,12 @@ class UploadSessionService:
         )
 
         original_path = f"{base_storage_path}/{original_name}"
-        await self.storage.store_file(original_path, content, original_content_type)
+        # Stream the spooled upload to MinIO instead of reading it into memory
+        file_size = file.size if file.size is not None else await asyncio.to_thread(_spooled_size, file.file)
+        await file.seek(0)
+        await self.storage.store_stream(original_path, file.file, file_size, original_content_type)
 
-        document = Document(
+        return Document(
             document_id=document_id,
             upload_session_id=upload_session.upload_session_id,
             job_id=None,  # Will be set when committed
@@ -165,20 +259,10 @@ class UploadSessionService:
             file_path=base_storage_path,
             original_file_path=original_path,
             original_filename=original_name,
-            file_size=len(content),
+            file_size=file_size,
             mime_type=original_content_type,
             status=DocumentStatusEnum.UPLOADED.value,
         )
-        session.add(document)
-        await session.commit()
-
-        logger.info(
-            "upload_session.file_uploaded",
-            upload_session_id=upload_session.upload_session_id,
-            document_id=document_id,
-            filename=original_name,
-        )
-        return document
 
     async def delete_file(
         self,
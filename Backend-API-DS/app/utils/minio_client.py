@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from datetime import timedelta
 from functools import lru_cache
 from io import BytesIO
-from typing import BinaryIO
+from typing import AsyncIterator, BinaryIO
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 
 from app.config.settings import get_settings
 
@@ -22,6 +27,25 @@ class AsyncMinioClient:
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_secure,
+            http_client=self._build_http_client(settings.minio_max_pool_connections),
+        )
+
+    @staticmethod
+    def _build_http_client(max_connections: int) -> urllib3.PoolManager:
+        # Same settings as the SDK's default pool, which keeps only 10 connections;
+        # block=False opens extra connections on bursts instead of waiting
+        timeout = timedelta(minutes=5).seconds
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=max_connections,
+            block=False,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
         )
 
     async def ensure_bucket(self) -> None:
@@ -65,9 +89,86 @@ class AsyncMinioClient:
         except Exception as e:
             raise ConnectionError(f"Failed to download from MinIO: {e}. Please ensure MinIO is running.") from e
 
-    async def upload_stream(self, object_name: str, stream: BinaryIO, content_type: str) -> None:
-        data = stream.read()
-        await self.upload(object_name, data, content_type)
+    async def stat(self, object_name: str) -> tuple[int, str | None]:
+        """Size in bytes and ETag of an object."""
+        try:
+            stat = await asyncio.to_thread(
+                self._client.stat_object,
+                bucket_name=self.bucket,
+                object_name=object_name,
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to stat MinIO object: {e}. Please ensure MinIO is running.") from e
+        return stat.size, stat.etag
+
+    async def open_stream(
+        self,
+        object_name: str,
+        chunk_size: int = 64 * 1024,
+        offset: int = 0,
+        length: int = 0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Open an object, or a byte range of it (length 0 reads to the end), for streaming.
+        The GET is issued here so missing objects fail before a response starts; the
+        body is then read chunk by chunk.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self._client.get_object,
+                bucket_name=self.bucket,
+                object_name=object_name,
+                offset=offset,
+                length=length,
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to download from MinIO: {e}. Please ensure MinIO is running.") from e
+        return self._iter_response(response, chunk_size)
+
+    @staticmethod
+    async def _iter_response(response, chunk_size: int) -> AsyncIterator[bytes]:
+        try:
+            chunks = response.stream(chunk_size)
+            while chunk := await asyncio.to_thread(next, chunks, b""):
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def presigned_download_url(self, object_name: str, expires: timedelta) -> str:
+        """Presigned GET URL so clients can fetch an object directly from MinIO."""
+        try:
+            return await asyncio.to_thread(
+                self._client.presigned_get_object,
+                bucket_name=self.bucket,
+                object_name=object_name,
+                expires=expires,
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to presign MinIO URL: {e}. Please ensure MinIO is running.") from e
+
+    async def upload_stream(
+        self,
+        object_name: str,
+        stream: BinaryIO,
+        length: int,
+        content_type: str,
+        part_size: int = 5 * 1024 * 1024,
+    ) -> None:
+        """Upload from a file-like object; the SDK reads it in part_size chunks."""
+        try:
+            await self.ensure_bucket()
+            await asyncio.to_thread(
+                self._client.put_object,
+                bucket_name=self.bucket,
+                object_name=object_name,
+                data=stream,
+                length=length,
+                content_type=content_type,
+                part_size=part_size,
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to upload to MinIO: {e}. Please ensure MinIO is running.") from e
 
     async def delete_file(self, object_name: str) -> None:
         """Delete a single file from MinIO."""
@@ -103,24 +204,50 @@ class AsyncMinioClient:
         except Exception as e:
             raise ConnectionError(f"Failed to delete directory from MinIO: {e}. Please ensure MinIO is running.") from e
 
-    async def list_objects_in_directory(self, directory_path: str) -> list[str]:
-        """List all object names (paths) in a directory from MinIO."""
+    async def delete_files(self, object_names: list[str]) -> None:
+        """Delete many objects from MinIO using multi-object delete requests."""
+        if not object_names:
+            return
         try:
             await self.ensure_bucket()
-            objects = await asyncio.to_thread(
-                self._client.list_objects,
-                bucket_name=self.bucket,
-                prefix=directory_path,
-                recursive=True,
+            errors = await asyncio.to_thread(self._remove_objects, object_names)
+        except Exception as e:
+            raise ConnectionError(f"Failed to delete files from MinIO: {e}. Please ensure MinIO is running.") from e
+        if errors:
+            raise ConnectionError(f"Failed to delete {len(errors)} file(s) from MinIO: {errors[0]}")
+
+    def _remove_objects(self, object_names: list[str]) -> list:
+        # remove_objects is lazy; draining the iterator issues the batched requests
+        delete_list = [DeleteObject(name) for name in object_names]
+        return list(self._client.remove_objects(self.bucket, delete_list))
+
+    async def list_objects(self, directory_path: str) -> list[str]:
+        """List all object names (paths) under a directory, raising if MinIO cannot be listed."""
+        try:
+            await self.ensure_bucket()
+            # list_objects is lazy and pages through results while iterated, so the
+            # iteration itself must run in the worker thread
+            return await asyncio.to_thread(
+                lambda: [
+                    obj.object_name
+                    for obj in self._client.list_objects(
+                        bucket_name=self.bucket,
+                        prefix=directory_path,
+                        recursive=True,
+                    )
+                ]
             )
-            
-            # Return list of object names
-            return [obj.object_name for obj in objects]
         except Exception as e:
+            raise ConnectionError(f"Failed to list directory in MinIO: {e}. Please ensure MinIO is running.") from e
+
+    async def list_objects_in_directory(self, directory_path: str) -> list[str]:
+        """List all object names (paths) in a directory from MinIO."""
+        try:
+            return await self.list_objects(directory_path)
+        except ConnectionError:
             # Return empty list if directory doesn't exist
             return []
 
-
 @lru_cache
 def get_minio_client() -> AsyncMinioClient:
     return AsyncMinioClient()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.config.settings import get_settings
+
+
+@lru_cache
+def get_redis_client() -> Redis | None:
+    """Shared async Redis client for caching, or None when no cache URL is configured."""
+    url = get_settings().redis_cache_url
+    if not url:
+        return None
+    return Redis.from_url(url)
@@ -20,6 +20,8 @@ if str(ensemble_dir) not in sys.path:
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 # New authentication and user management routers
 from app.api.auth_routes import router as auth_router
@@ -90,6 +92,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress text responses such as JSON listings and reports. Small bodies are left
+# alone, and so are file downloads (zip, images, PDFs, octet-stream): they are
+# already compressed, and gzip would drop their Content-Length. A low level keeps
+# the CPU cost per response small
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/octet-stream", "application/pdf"),
+)
+
 # ============================================
 # NEW API Routers (v2 - with user management)
 # ============================================